@@ -24,6 +24,13 @@ except ImportError:
     _HAS_CLOB_CLIENT = False
     print("⚠️ py-clob-client non installé. pip install py-clob-client")
 
+# Endpoint batch /orders (versions récentes de py-clob-client)
+try:
+    from py_clob_client.clob_types import PostOrdersArgs
+    _HAS_BATCH_ORDERS = True
+except ImportError:
+    _HAS_BATCH_ORDERS = False
+
 
 class SignatureType(Enum):
     """Types de signature supportés par Polymarket."""
@@ -85,6 +92,7 @@ class PolymarketPrivate:
 
         self._client: Optional[ClobClient] = None
         self._initialized = False
+        self._late_cancels: set = set()  # Annulations d'ordres arrivés après timeout
         self._mock_mode = not _HAS_CLOB_CLIENT or not private_key
 
         if self._mock_mode:
@@ -132,6 +140,24 @@ class PolymarketPrivate:
         """Vérifie si le client est prêt pour trader."""
         return self._initialized and self._client is not None
 
+    async def prime_connection(self) -> bool:
+        """
+        Ouvre la connexion HTTPS vers le CLOB (TCP + TLS) avant le premier ordre.
+
+        Returns:
+            True si le CLOB a répondu
+        """
+        if self._mock_mode:
+            return True
+
+        try:
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(None, self._client.get_ok)
+            return True
+        except Exception as e:
+            print(f"⚠️ Pré-connexion CLOB échouée: {e}")
+            return False
+
     async def get_balance(self) -> Dict[str, float]:
         """Récupère les balances du wallet."""
         if self._mock_mode:
@@ -209,6 +235,98 @@ class PolymarketPrivate:
             print(f"❌ Erreur create_limit_order: {e}")
             return {"error": str(e), "status": "FAILED"}
 
+    async def place_orders_batch(
+        self,
+        orders: List[Dict[str, Any]],
+        time_in_force: str = "GTC",
+        post_timeout: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Place plusieurs ordres limites en un seul aller-retour HTTP.
+
+        Les ordres sont signés en parallèle puis soumis ensemble via
+        l'endpoint batch du CLOB. Chaque ordre reste indépendant côté
+        serveur: un leg peut être accepté et l'autre rejeté.
+
+        Args:
+            orders: Liste de dicts {token_id, side, price, size}
+            time_in_force: GTC (Good Till Cancel) ou FOK (Fill or Kill)
+            post_timeout: Budget (s) de la seule requête POST, signature
+                exclue. None/0 = pas de limite.
+
+        Returns:
+            Une réponse par ordre, dans le même ordre que `orders`
+
+        Raises:
+            asyncio.TimeoutError: POST hors budget. La requête continue dans
+                son thread: les IDs qu'elle renverra seront annulés dès
+                réception (les ordres ne restent pas orphelins dans le carnet).
+        """
+        if self._mock_mode:
+            return [
+                await self.create_limit_order(
+                    o["token_id"], o["side"], o["price"], o["size"], time_in_force
+                )
+                for o in orders
+            ]
+
+        if not _HAS_BATCH_ORDERS:
+            # SDK trop ancien: repli sur des ordres individuels concurrents
+            return list(await asyncio.gather(*(
+                self.create_limit_order(
+                    o["token_id"], o["side"], o["price"], o["size"], time_in_force
+                )
+                for o in orders
+            )))
+
+        try:
+            loop = asyncio.get_event_loop()
+            order_type = OrderType.GTC if time_in_force == "GTC" else OrderType.FOK
+
+            # Signer tous les ordres en parallèle
+            signed_orders = await asyncio.gather(*(
+                loop.run_in_executor(
+                    None,
+                    self._client.create_order,
+                    OrderArgs(
+                        token_id=o["token_id"],
+                        price=o["price"],
+                        size=o["size"],
+                        side=BUY if o["side"].upper() == "BUY" else SELL,
+                    )
+                )
+                for o in orders
+            ))
+
+            # Une seule requête pour tous les ordres
+            post = loop.run_in_executor(
+                None,
+                self._client.post_orders,
+                [PostOrdersArgs(order=signed, orderType=order_type) for signed in signed_orders]
+            )
+            if post_timeout:
+                try:
+                    # shield: le timeout ne perd pas la réponse du thread
+                    result = await asyncio.wait_for(asyncio.shield(post), post_timeout)
+                except asyncio.TimeoutError:
+                    task = asyncio.ensure_future(self._cancel_late_orders(post))
+                    self._late_cancels.add(task)  # Référence forte jusqu'à la fin
+                    task.add_done_callback(self._late_cancels.discard)
+                    raise
+            else:
+                result = await post
+
+            print(f"✅ Batch de {len(orders)} ordres placé")
+            return result
+
+        except asyncio.TimeoutError:
+            print(f"⏱️ Batch de {len(orders)} ordres hors budget ({post_timeout:.2f}s)")
+            raise
+
+        except Exception as e:
+            print(f"❌ Erreur place_orders_batch: {e}")
+            return [{"error": str(e), "status": "FAILED"} for _ in orders]
+
     async def create_market_order(
         self,
         token_id: str,
@@ -284,6 +402,80 @@ class PolymarketPrivate:
             print(f"❌ Erreur cancel_order: {e}")
             return False
 
+    async def cancel_orders(self, order_ids: List[str]) -> bool:
+        """
+        Annule plusieurs ordres en une seule requête.
+
+        Args:
+            order_ids: IDs des ordres à annuler
+
+        Returns:
+            True si annulés avec succès
+        """
+        if not order_ids:
+            return True
+
+        if self._mock_mode:
+            print(f"📝 [SIMULATION] Cancel {len(order_ids)} orders")
+            return True
+
+        try:
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(
+                None,
+                self._client.cancel_orders,
+                list(order_ids)
+            )
+            print(f"✅ {len(order_ids)} ordres annulés")
+            return True
+
+        except Exception as e:
+            print(f"❌ Erreur cancel_orders: {e}")
+            return False
+
+    async def amend_orders(
+        self,
+        order_ids: List[str],
+        orders: List[Dict[str, Any]],
+        time_in_force: str = "GTC"
+    ) -> List[Dict[str, Any]]:
+        """
+        Remplace des ordres existants par de nouveaux prix/tailles.
+
+        Le CLOB Polymarket n'expose pas de modification d'ordre: repli sur
+        une annulation groupée suivie d'un batch de création, soit deux
+        requêtes quel que soit le nombre d'ordres. Rien n'est placé si
+        l'annulation échoue (pas de double exposition).
+
+        Args:
+            order_ids: IDs des ordres à remplacer
+            orders: Nouveaux ordres {token_id, side, price, size}
+            time_in_force: GTC (Good Till Cancel) ou FOK (Fill or Kill)
+
+        Returns:
+            Une réponse par nouvel ordre, dans le même ordre que `orders`
+        """
+        if not await self.cancel_orders(order_ids):
+            return [{"error": "cancel failed", "status": "FAILED"} for _ in orders]
+        return await self.place_orders_batch(orders, time_in_force)
+
+    async def _cancel_late_orders(self, post: "asyncio.Future") -> None:
+        """
+        Attend la réponse d'un POST batch abandonné (timeout) et annule
+        les ordres qu'il a créés, par leurs IDs uniquement.
+        """
+        try:
+            result = await post
+            late_ids = [
+                r["orderID"] for r in result
+                if isinstance(r, dict) and r.get("orderID")
+            ]
+            if late_ids:
+                print(f"🗑️ Annulation de {len(late_ids)} ordres arrivés après timeout")
+                await self.cancel_orders(late_ids)
+        except Exception as e:
+            print(f"❌ Erreur annulation ordres après timeout: {e}")
+
     async def cancel_all_orders(self) -> bool:
         """Annule tous les ordres ouverts."""
         if self._mock_mode:
@@ -53,16 +53,24 @@ class CoinGeckoClient:
         "BNB": "binancecoin",
     }
 
-    def __init__(self):
+    def __init__(self, timeout: float = 10.0):
         self._client: Optional[httpx.AsyncClient] = None
+        self._timeout = timeout
         # Cache pour éviter rate limiting
         self._cache: Dict[str, tuple[float, Any]] = {}  # key -> (timestamp, data)
         self._last_request_time: float = 0
 
     async def __aenter__(self):
+        # Petit pool keep-alive: garde TCP/TLS chaud entre deux appels espacés
+        limits = httpx.Limits(
+            max_keepalive_connections=4,
+            max_connections=4,
+            keepalive_expiry=75.0
+        )
         self._client = httpx.AsyncClient(
             base_url=self.BASE_URL,
-            timeout=10,
+            timeout=self._timeout,
+            limits=limits,
             headers={"Accept": "application/json"}
         )
         return self
@@ -314,7 +314,7 @@ class PolymarketPublicClient:
 
         Args:
             token_id: ID du token (YES ou NO)
-            use_cache: Utiliser le cache (défaut: True, TTL 2s)
+            use_cache: Utiliser le cache (défaut: True, TTL orderbook_cache: 0.5s)
 
         Returns:
             Orderbook avec bids et asks
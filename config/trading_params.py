@@ -9,7 +9,40 @@ import os
 import json
 from pathlib import Path
 from dataclasses import dataclass, field, asdict
-from typing import Optional, List
+from functools import lru_cache
+from typing import Optional, List, Union
+
+
+# Chemin par défaut parsé une seule fois
+DEFAULT_PARAMS_PATH = Path("config/trading_params.json")
+
+# Répertoires déjà créés (évite stat+mkdir à chaque sauvegarde)
+_SAVED_DIRS: set[Path] = set()
+
+
+@lru_cache(maxsize=64)
+def _validate(
+    min_spread: float,
+    max_spread: float,
+    capital_per_trade: float,
+    max_open_positions: int,
+    max_total_exposure: float,
+) -> tuple[str, ...]:
+    """Validation mémoïsée sur les champs concernés (appelée à chaque submit UI)."""
+    errors = []
+
+    if min_spread < 0.01:
+        errors.append("Spread minimum doit être >= 0.01$")
+    if min_spread > max_spread:
+        errors.append("Spread minimum doit être <= spread maximum")
+    if capital_per_trade < 1:
+        errors.append("Capital par trade doit être >= 1$")
+    if max_open_positions < 1:
+        errors.append("Positions max doit être >= 1")
+    if capital_per_trade * max_open_positions > max_total_exposure:
+        errors.append("Exposition totale risque d'être dépassée")
+
+    return tuple(errors)
 
 
 @dataclass
@@ -49,6 +82,7 @@ class TradingParams:
     order_offset: float = 0.01          # Décalage du prix (1¢ off-best)
     position_timeout_seconds: int = 0   # 0 = pas de fermeture auto (manuel)
     min_time_between_trades: int = 5    # Secondes entre trades
+    order_post_timeout_s: float = 5.0   # Budget max du POST batch des ordres (s), 0 = illimité
 
     # ═══════════════════════════════════════════════════════════════
     # ASSETS CIBLES (configurables)
@@ -70,17 +104,20 @@ class TradingParams:
         """Crée une instance depuis un dictionnaire."""
         return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
     
-    def save(self, filepath: str = "config/trading_params.json") -> None:
+    def save(self, filepath: Union[str, Path] = DEFAULT_PARAMS_PATH) -> None:
         """Sauvegarde les paramètres dans un fichier JSON."""
-        path = Path(filepath)
-        path.parent.mkdir(parents=True, exist_ok=True)
+        path = filepath if isinstance(filepath, Path) else Path(filepath)
+        parent = path.parent
+        if parent not in _SAVED_DIRS:
+            parent.mkdir(parents=True, exist_ok=True)
+            _SAVED_DIRS.add(parent)
         with open(path, "w") as f:
             json.dump(self.to_dict(), f, indent=2)
     
     @classmethod
-    def load(cls, filepath: str = "config/trading_params.json") -> "TradingParams":
+    def load(cls, filepath: Union[str, Path] = DEFAULT_PARAMS_PATH) -> "TradingParams":
         """Charge les paramètres depuis un fichier JSON."""
-        path = Path(filepath)
+        path = filepath if isinstance(filepath, Path) else Path(filepath)
         if path.exists():
             with open(path, "r") as f:
                 data = json.load(f)
@@ -89,20 +126,14 @@ class TradingParams:
     
     def validate(self) -> list[str]:
         """Valide les paramètres et retourne les erreurs."""
-        errors = []
-        
-        if self.min_spread < 0.01:
-            errors.append("Spread minimum doit être >= 0.01$")
-        if self.min_spread > self.max_spread:
-            errors.append("Spread minimum doit être <= spread maximum")
-        if self.capital_per_trade < 1:
-            errors.append("Capital par trade doit être >= 1$")
-        if self.max_open_positions < 1:
-            errors.append("Positions max doit être >= 1")
-        if self.capital_per_trade * self.max_open_positions > self.max_total_exposure:
-            errors.append("Exposition totale risque d'être dépassée")
-            
-        return errors
+        # Clé calculée à chaque appel: reste correcte si l'UI mute les champs
+        return list(_validate(
+            self.min_spread,
+            self.max_spread,
+            self.capital_per_trade,
+            self.max_open_positions,
+            self.max_total_exposure,
+        ))
 
 
 # Instance globale avec chargement depuis fichier
@@ -41,7 +41,7 @@ class OpportunityAction(Enum):
     SKIP = "skip"        # Ignorer
 
 
-@dataclass
+@dataclass(slots=True)
 class Opportunity:
     """
     Représente une opportunité de trading détectée.
@@ -66,6 +66,7 @@ class Opportunity:
     best_ask_no: float
     spread_yes: float
     spread_no: float
+    effective_spread: float  # Spread moyen (pré-calculé: clé de tri)
     
     # Prix recommandés pour placement d'ordres
     recommended_price_yes: float
@@ -86,15 +87,14 @@ class Opportunity:
     detected_at: datetime = field(default_factory=datetime.now)
     expires_at: Optional[datetime] = None
     
-    @property
-    def effective_spread(self) -> float:
-        """Spread moyen."""
-        return (self.spread_yes + self.spread_no) / 2
+    # Taille des ordres (shares par côté), pré-calculée pour les opportunités TRADE
+    size: Optional[float] = None
     
-    @property
-    def potential_profit_per_share(self) -> float:
-        """Profit potentiel par share (estimation)."""
-        return self.effective_spread * 0.5  # Estimation conservatrice
+    # Profit potentiel par share (estimation), dérivé à la construction
+    potential_profit_per_share: float = field(init=False)
+    
+    def __post_init__(self):
+        self.potential_profit_per_share = self.effective_spread * 0.5  # Estimation conservatrice
     
     @property
     def score_stars(self) -> str:
@@ -139,13 +139,24 @@ class OpportunityAnalyzer:
         """Met à jour les paramètres."""
         self._params = params
     
-    def analyze_market(self, market_data: MarketData, volatility_map: dict = None) -> Optional[Opportunity]:
+    def analyze_market(
+        self,
+        market_data: MarketData,
+        volatility_map: dict = None,
+        keep_skip: bool = True,
+        scan_ns: Optional[int] = None,
+        scanned_at: Optional[datetime] = None
+    ) -> Optional[Opportunity]:
         """
         Analyse un marché et retourne une opportunité si valide.
         
         Args:
             market_data: Données du marché
             volatility_map: Map optionnelle {asset_symbol: volatility_score}
+            keep_skip: Si False, les marchés notés SKIP (score < 3) ne
+                génèrent pas d'Opportunity (évite l'allocation inutile)
+            scan_ns: Horodatage du scan (time.time_ns), capturé une fois par scan
+            scanned_at: datetime du scan, partagé par toutes les opportunités
             
         Returns:
             Opportunity si les critères sont remplis, None sinon
@@ -196,14 +207,25 @@ class OpportunityAnalyzer:
             action = OpportunityAction.TRADE
         elif score >= 3:
             action = OpportunityAction.WATCH
+        elif not keep_skip:
+            return None  # SKIP: pas de construction d'Opportunity
         else:
             action = OpportunityAction.SKIP
         
+        # Taille des ordres: capital réparti entre YES et NO au prix moyen
+        size = None
+        if action is OpportunityAction.TRADE:
+            size = round(
+                self._params.capital_per_trade / (recommended_yes + recommended_no), 2
+            )
+        
         # Créer l'opportunité
         self._opportunity_counter += 1
+        if scan_ns is None:
+            scan_ns = time.time_ns()
         
         return Opportunity(
-            id=f"opp_{self._opportunity_counter}_{int(datetime.now().timestamp())}",
+            id="opp_%d_%d" % (self._opportunity_counter, scan_ns),
             market_id=market.id,
             question=market.question,
             token_yes_id=market.token_yes_id,
@@ -214,6 +236,7 @@ class OpportunityAnalyzer:
             best_ask_no=market_data.best_ask_no or 0,
             spread_yes=spread_yes,
             spread_no=spread_no,
+            effective_spread=effective_spread,
             recommended_price_yes=recommended_yes,
             recommended_price_no=recommended_no,
             volume=market.volume,
@@ -221,8 +244,9 @@ class OpportunityAnalyzer:
             score=score,
             score_breakdown=breakdown,
             action=action,
-            detected_at=datetime.now(),
+            detected_at=scanned_at or datetime.now(),
             expires_at=market.end_date,
+            size=size,
         )
     
     def _calculate_score(
@@ -377,21 +401,30 @@ class OpportunityAnalyzer:
     def analyze_all_markets(
         self,
         markets: dict[str, MarketData],
-        volatility_map: dict = None
+        volatility_map: dict = None,
+        keep_skip: bool = True
     ) -> list[Opportunity]:
         """
         Analyse tous les marchés et retourne les opportunités.
 
         Args:
             markets: Dictionnaire de MarketData
+            volatility_map: Map optionnelle de volatilité
+            keep_skip: Inclure les opportunités SKIP (affichage UI)
 
         Returns:
             Liste d'opportunités triées par score (desc)
         """
         opportunities = []
 
+        # Un seul horodatage par scan (aucun datetime.now() par marché)
+        scan_ns = time.time_ns()
+        scanned_at = datetime.fromtimestamp(scan_ns / 1e9)
+
         for market_data in markets.values():
-            opportunity = self.analyze_market(market_data, volatility_map)
+            opportunity = self.analyze_market(
+                market_data, volatility_map, keep_skip, scan_ns, scanned_at
+            )
             if opportunity:
                 opportunities.append(opportunity)
 
@@ -404,7 +437,8 @@ class OpportunityAnalyzer:
         self,
         markets: dict[str, MarketData],
         volatility_map: dict = None,
-        max_workers: int = 4
+        max_workers: int = 4,
+        keep_skip: bool = True
     ) -> list[Opportunity]:
         """
         5.9: Analyse parallèle de tous les marchés (CPU-bound).
@@ -416,6 +450,7 @@ class OpportunityAnalyzer:
             markets: Dictionnaire de MarketData
             volatility_map: Map optionnelle de volatilité
             max_workers: Nombre de workers parallèles
+            keep_skip: Inclure les opportunités SKIP (affichage UI)
 
         Returns:
             Liste d'opportunités triées par score (desc)
@@ -425,6 +460,8 @@ class OpportunityAnalyzer:
 
         loop = asyncio.get_event_loop()
         market_list = list(markets.values())
+        scan_ns = time.time_ns()
+        scanned_at = datetime.fromtimestamp(scan_ns / 1e9)
 
         # Utiliser ThreadPoolExecutor pour paralléliser le travail CPU
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
@@ -434,7 +471,10 @@ class OpportunityAnalyzer:
                     executor,
                     self.analyze_market,
                     market_data,
-                    volatility_map
+                    volatility_map,
+                    keep_skip,
+                    scan_ns,
+                    scanned_at
                 )
                 for market_data in market_list
             ]
@@ -466,7 +506,8 @@ class OpportunityAnalyzer:
         Returns:
             Liste d'opportunités avec action=TRADE
         """
-        all_opportunities = self.analyze_all_markets(markets)
+        # Les SKIP sont filtrés dès analyze_market (aucune allocation)
+        all_opportunities = self.analyze_all_markets(markets, keep_skip=False)
         return [op for op in all_opportunities if op.action == OpportunityAction.TRADE]
     
     def should_trade(self, opportunity: Opportunity) -> bool:
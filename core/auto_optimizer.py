@@ -13,17 +13,90 @@ Modes:
 """
 
 import asyncio
+import logging
+import math
+import time
+from bisect import bisect_left
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from typing import Optional, Dict, List, TYPE_CHECKING
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from enum import Enum
 
+from core.performance import get_async_logger
+
 if TYPE_CHECKING:
     from core.scanner import Scanner, MarketData
     from core.gabagool import GabagoolEngine, PairPosition
     from api.public.coingecko_client import CoinGeckoClient
 
 
+# Logger module (formatage %s paresseux: rien n'est formaté si le niveau est filtré)
+log = get_async_logger("optimizer")
+
+
+# ═══════════════════════════════════════════════════════════════
+# TABLES DE SEUILS (bisect_left: index = nb de seuils strictement < valeur)
+# ═══════════════════════════════════════════════════════════════
+
+def _inclusive(edge: float) -> float:
+    """Seuil inclusif (x >= edge) exprimé pour bisect_left (x > edge)."""
+    return math.nextafter(edge, -math.inf)
+
+
+# max_pair_cost selon spread / ajustement selon volatilité
+_MAXPC_SPREAD_EDGES = (_inclusive(0.06), 0.10, 0.15)
+_MAXPC_VALUES = (0.98, 0.95, 0.94, 0.92)
+_MAXPC_VOL_EDGES = (_inclusive(30.0), 70.0)
+_MAXPC_VOL_ADJ = (0.01, 0.0, -0.02)
+
+# min_improvement selon pair_cost moyen
+_MINIMP_PAIR_COST_EDGES = (0.94, 0.96, 0.98)
+_MINIMP_VALUES = (0.008, 0.005, 0.002, 0.001)
+
+# order_size_usd selon liquidité
+_ORDER_SIZE_LIQ_EDGES = (_inclusive(10000.0), 20000.0, 50000.0, 100000.0)
+_ORDER_SIZE_VALUES = (15.0, 25.0, 35.0, 50.0, 75.0)
+
+# max_position_usd selon liquidité
+_MAX_POS_LIQ_EDGES = (_inclusive(20000.0), 50000.0, 100000.0)
+_MAX_POS_VALUES = (300.0, 500.0, 750.0, 1000.0)
+
+# first_buy_threshold selon spread / ajustement selon volatilité
+_FIRST_BUY_SPREAD_EDGES = (_inclusive(0.06), 0.12)
+_FIRST_BUY_VALUES = (0.60, 0.55, 0.50)
+_FIRST_BUY_VOL_EDGES = (_inclusive(30.0), 70.0)
+_FIRST_BUY_VOL_ADJ = (0.05, 0.0, -0.05)
+
+
+# Paramètres appliqués au GabagoolConfig: (nom, raison, format, zéro significatif)
+# zéro significatif: un passage 0 → x (ex: min_improvement) compte comme changement
+_APPLY_SPEC = (
+    ("max_pair_cost", "spread/volatility", "{:.3f}", False),
+    ("min_improvement", "position_state", "{:.4f}", True),
+    ("order_size_usd", "liquidity", "${:.0f}", False),
+    ("max_position_usd", "liquidity/diversification", "${:.0f}", False),
+    ("first_buy_threshold", "spread", "{:.3f}", False),
+)
+
+# Seuil de changement significatif (1%)
+_APPLY_THRESHOLD = 0.01
+
+
+def _rel_changed(old: float, new: float, th: float = _APPLY_THRESHOLD) -> bool:
+    """True si |new - old| > th * |old| (multiplication plutôt que division)."""
+    return abs(new - old) > th * abs(old)
+
+
+def _param_changed(old: float, new: float, zero_significant: bool) -> bool:
+    """True si l'écart relatif dépasse le seuil (gère old == 0)."""
+    if not old:
+        return zero_significant and new > 0
+    return _rel_changed(old, new)
+
+
 class OptimizerMode(Enum):
     """Mode de fonctionnement de l'optimiseur."""
     MANUAL = "manual"           # Paramètres fixes
@@ -31,7 +104,7 @@ class OptimizerMode(Enum):
     FULL_AUTO = "full_auto"     # Ajustement automatique
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketConditions:
     """Snapshot des conditions de marché actuelles."""
     avg_spread: float = 0.10            # Spread moyen sur les marchés actifs
@@ -44,8 +117,21 @@ class MarketConditions:
     ws_connected: bool = False          # WebSocket actif
     timestamp: datetime = field(default_factory=datetime.now)
 
+    def to_dict(self) -> dict:
+        """Convertit en dictionnaire (valeurs arrondies pour le dashboard)."""
+        return {
+            "avg_spread": round(self.avg_spread, 4),
+            "avg_volume": round(self.avg_volume, 0),
+            "avg_liquidity": round(self.avg_liquidity, 0),
+            "volatility_score": round(self.volatility_score, 1),
+            "active_positions": self.active_positions,
+            "locked_positions": self.locked_positions,
+            "avg_pair_cost": round(self.avg_pair_cost, 4),
+            "ws_connected": self.ws_connected,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class OptimizedParams:
     """Paramètres optimisés calculés."""
     max_pair_cost: float = 0.98         # 0.90 - 0.99 selon conditions
@@ -67,7 +153,27 @@ class OptimizedParams:
         }
 
 
-@dataclass
+def _conditions_key(conditions: MarketConditions) -> tuple:
+    """Empreinte quantifiée des conditions (entrées des _optimize_*)."""
+    return (
+        round(conditions.avg_spread, 3),
+        round(conditions.avg_liquidity, -3),
+        round(conditions.volatility_score, 0),
+        conditions.active_positions,
+        round(conditions.avg_pair_cost, 3),
+        conditions.ws_connected,
+    )
+
+
+# Paramètres comparés dans get_suggestions
+_SUGGESTION_KEYS = ("max_pair_cost", "min_improvement", "order_size_usd", "max_position_usd")
+
+
+# Champs suggérables (noms des paramètres optimisés)
+_OPTIMIZED_FIELDS = frozenset(f.name for f in fields(OptimizedParams))
+
+
+@dataclass(slots=True)
 class OptimizationEvent:
     """Événement de modification de paramètres."""
     timestamp: datetime
@@ -75,6 +181,23 @@ class OptimizationEvent:
     old_value: float
     new_value: float
     reason: str
+    _dict: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+
+    def to_dict(self) -> dict:
+        """
+        Convertit en dictionnaire (construit une seule fois: événement immuable).
+
+        Retourne une copie: l'appelant peut la modifier sans toucher au cache.
+        """
+        if self._dict is None:
+            self._dict = {
+                "timestamp": self.timestamp.isoformat(),
+                "param": self.param_name,
+                "old": self.old_value,
+                "new": self.new_value,
+                "reason": self.reason
+            }
+        return dict(self._dict)
 
 
 class AutoOptimizer:
@@ -110,19 +233,54 @@ class AutoOptimizer:
         # État actuel
         self._conditions: Optional[MarketConditions] = None
         self._current_params: OptimizedParams = OptimizedParams()
+        # Vues dict pré-calculées pour get_status (rafraîchies à chaque tick)
+        self._optimized_dict: dict = self._current_params.to_dict()
+        self._conditions_dict: dict = {}
         self._last_update: Optional[datetime] = None
+        self._tick_now: datetime = datetime.now()  # Horloge partagée par tick
+        self._last_fingerprint: Optional[tuple] = None  # (mode, conditions quantifiées)
 
-        # Historique des modifications
-        self._events: List[OptimizationEvent] = []
+        # Historique des modifications (100 derniers, éviction O(1))
+        self._events: deque[OptimizationEvent] = deque(maxlen=100)
+        self._recent_cache: tuple[OptimizationEvent, ...] = ()
+        self._recent_dirty = False
         self._total_adjustments = 0
 
         # Paramètres de base (référence)
         self._base_params = OptimizedParams()
 
+        # Mémoïsation de _compute_optimal_params (LRU sur conditions quantifiées)
+        self._params_cache: "OrderedDict[tuple, OptimizedParams]" = OrderedDict()
+        self._params_cache_size = 64
+
+        # Offload du calcul hors event loop, décidé à la 1ère mesure (> 1ms)
+        self._compute_offload_threshold = 0.001
+        self._compute_offload: Optional[bool] = None
+        self._compute_executor: Optional[ThreadPoolExecutor] = None
+
         # Client CoinGecko persistent (évite rate limit)
         self._cg_client: Optional["CoinGeckoClient"] = None
         self._cg_client_initialized = False
 
+        # Cache du score de volatilité (free tier CoinGecko: 10-30 req/min)
+        self._vol_cache_value: float = 50.0  # Dernière valeur valide (défaut avant 1er fetch)
+        self._vol_cache_expiry: float = 0.0  # time.monotonic()
+        self._vol_cache_ttl: float = 300.0
+        self._vol_retry_delay: float = 30.0  # Backoff après un échec (panne, 429)
+        self._vol_fetch_timeout: float = 3.0
+
+        # Capacités de la config Gabagool liée (calculées une fois par objet config)
+        self._caps_config: Optional[object] = None
+        self._apply_spec: tuple = ()
+        self._suggestable: frozenset = frozenset()
+        self._has_first_buy = False
+
+        # Cache de get_suggestions: invalidé si config, params ou conditions changent
+        self._suggestions_snapshot: Optional[tuple] = None
+        self._suggestions_params: Optional[OptimizedParams] = None
+        self._suggestions_conditions: Optional[MarketConditions] = None
+        self._suggestions_cache: dict = {}
+
         # Callbacks
         self.on_params_updated: Optional[callable] = None
 
@@ -155,9 +313,13 @@ class AutoOptimizer:
         return self._total_adjustments
 
     @property
-    def recent_events(self) -> List[OptimizationEvent]:
-        """Retourne les 20 derniers événements."""
-        return self._events[-20:]
+    def recent_events(self) -> tuple[OptimizationEvent, ...]:
+        """Retourne les 20 derniers événements (tuple recalculé après mutation)."""
+        if self._recent_dirty:
+            n = len(self._events)
+            self._recent_cache = tuple(islice(self._events, max(0, n - 20), n))
+            self._recent_dirty = False
+        return self._recent_cache
 
     # ═══════════════════════════════════════════════════════════════
     # CONTRÔLE
@@ -169,8 +331,14 @@ class AutoOptimizer:
             return
 
         self._running = True
-        self._task = asyncio.create_task(self._optimization_loop())
-        print(f"🧠 [Optimizer] Démarré en mode {self.mode.value}")
+        # Python 3.12+: démarrage eager (le 1er tour s'exécute sans passer par
+        # le scheduler). Limité à cette tâche: pas de factory globale sur la loop.
+        if hasattr(asyncio, "eager_task_factory"):
+            loop = asyncio.get_running_loop()
+            self._task = asyncio.eager_task_factory(loop, self._optimization_loop())
+        else:
+            self._task = asyncio.create_task(self._optimization_loop())
+        log.info("🧠 [Optimizer] Démarré en mode %s", self.mode.value)
 
     async def stop(self) -> None:
         """Arrête la boucle d'optimisation."""
@@ -182,6 +350,14 @@ class AutoOptimizer:
             except asyncio.CancelledError:
                 pass
 
+        self._last_fingerprint = None
+
+        # Libérer le worker de calcul
+        if self._compute_executor:
+            self._compute_executor.shutdown(wait=False)
+            self._compute_executor = None
+            self._compute_offload = None
+
         # Fermer le client CoinGecko
         if self._cg_client:
             try:
@@ -191,13 +367,13 @@ class AutoOptimizer:
             self._cg_client = None
             self._cg_client_initialized = False
 
-        print("🧠 [Optimizer] Arrêté")
+        log.info("🧠 [Optimizer] Arrêté")
 
     def set_mode(self, mode: OptimizerMode) -> None:
         """Change le mode de fonctionnement."""
         old_mode = self.mode
         self.mode = mode
-        print(f"🧠 [Optimizer] Mode changé: {old_mode.value} → {mode.value}")
+        log.info("🧠 [Optimizer] Mode changé: %s → %s", old_mode.value, mode.value)
 
     # ═══════════════════════════════════════════════════════════════
     # BOUCLE PRINCIPALE
@@ -208,27 +384,40 @@ class AutoOptimizer:
         while self._running:
             try:
                 if self._enabled and self.mode != OptimizerMode.MANUAL:
+                    # Un seul datetime.now() par tick, réutilisé en aval
+                    self._tick_now = datetime.now()
+
                     # 1. Collecter les conditions actuelles
                     self._conditions = await self._collect_conditions()
+                    self._conditions_dict = self._conditions.to_dict()
+
+                    # Marché stable: rien à recalculer ni à appliquer
+                    fingerprint = (self.mode, _conditions_key(self._conditions))
+                    if fingerprint == self._last_fingerprint:
+                        await asyncio.sleep(self._update_interval)
+                        continue
+                    self._last_fingerprint = fingerprint
 
                     # 2. Calculer les paramètres optimaux
-                    optimized = self._compute_optimal_params(self._conditions)
+                    optimized = await self._compute_params(self._conditions)
 
                     # 3. Appliquer si changement significatif
                     if self.mode == OptimizerMode.FULL_AUTO:
                         changes = self._apply_params(optimized)
                         if changes:
-                            self._last_update = datetime.now()
+                            self._last_update = self._tick_now
 
                     # 4. Stocker pour mode SEMI_AUTO (suggestions)
-                    self._current_params = optimized
+                    if optimized is not self._current_params:
+                        self._current_params = optimized
+                        self._optimized_dict = optimized.to_dict()
 
                 await asyncio.sleep(self._update_interval)
 
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                print(f"⚠️ [Optimizer] Erreur: {e}")
+                log.warning("⚠️ [Optimizer] Erreur: %s", e)
                 await asyncio.sleep(self._update_interval)
 
     # ═══════════════════════════════════════════════════════════════
@@ -237,79 +426,159 @@ class AutoOptimizer:
 
     async def _collect_conditions(self) -> MarketConditions:
         """Collecte les métriques de marché actuelles."""
-        conditions = MarketConditions()
+        conditions = MarketConditions(timestamp=self._tick_now)
 
-        # Données du scanner
-        if self.scanner:
-            markets = list(self.scanner.markets.values())
+        # Volatilité en cache: pas de tâche à lancer
+        if time.monotonic() < self._vol_cache_expiry:
+            self._collect_local_conditions(conditions)
+            conditions.volatility_score = self._vol_cache_value
+            return conditions
 
-            if markets:
-                # Spread moyen
-                spreads = [m.effective_spread for m in markets if m.is_valid and m.effective_spread > 0]
-                if spreads:
-                    conditions.avg_spread = sum(spreads) / len(spreads)
+        # Sinon l'appel CoinGecko tourne en tâche, en parallèle des autres lectures
+        async with asyncio.TaskGroup() as tg:
+            vol_task = tg.create_task(self._get_volatility_score())
+            self._collect_local_conditions(conditions)
 
-                # Volume moyen
-                volumes = [m.market.volume for m in markets if m.market.volume > 0]
-                if volumes:
-                    conditions.avg_volume = sum(volumes) / len(volumes)
+        conditions.volatility_score = vol_task.result()
+        return conditions
 
-                # Liquidité moyenne
-                liquidities = [m.market.liquidity for m in markets if m.market.liquidity > 0]
-                if liquidities:
-                    conditions.avg_liquidity = sum(liquidities) / len(liquidities)
+    def _collect_local_conditions(self, conditions: MarketConditions) -> None:
+        """Remplit les métriques scanner/Gabagool (lectures en mémoire)."""
+        # Données du scanner
+        averages = self.scanner.market_averages if self.scanner else None
+        if averages is not None:
+            # Agrégats maintenus par le scanner à chaque update: O(1)
+            avg_spread, avg_volume, avg_liquidity = averages
+            if avg_spread is not None:
+                conditions.avg_spread = avg_spread
+            if avg_volume is not None:
+                conditions.avg_volume = avg_volume
+            if avg_liquidity is not None:
+                conditions.avg_liquidity = avg_liquidity
+        elif self.scanner:
+            # Fallback: un seul passage sur les marchés
+            spread_sum = volume_sum = liquidity_sum = 0.0
+            spread_n = volume_n = liquidity_n = 0
+
+            for m in self.scanner.markets.values():
+                if m.is_valid:
+                    spread = m.effective_spread
+                    if spread > 0:
+                        spread_sum += spread
+                        spread_n += 1
+                market = m.market
+                volume = market.volume
+                if volume > 0:
+                    volume_sum += volume
+                    volume_n += 1
+                liquidity = market.liquidity
+                if liquidity > 0:
+                    liquidity_sum += liquidity
+                    liquidity_n += 1
+
+            if spread_n:
+                conditions.avg_spread = spread_sum / spread_n
+            if volume_n:
+                conditions.avg_volume = volume_sum / volume_n
+            if liquidity_n:
+                conditions.avg_liquidity = liquidity_sum / liquidity_n
 
             # WebSocket status
             conditions.ws_connected = self.scanner._ws_feed.is_connected if self.scanner._ws_feed else False
 
         # Données Gabagool
         if self.gabagool:
-            positions = self.gabagool.get_all_positions()
-            active = [p for p in positions if not p.is_locked]
-            locked = [p for p in positions if p.is_locked]
-
-            conditions.active_positions = len(active)
-            conditions.locked_positions = len(locked)
+            # Un seul passage: comptage actives/verrouillées + pair cost des actives
+            active_count = locked_count = 0
+            pair_cost_sum = 0.0
+            for p in self.gabagool.get_all_positions():
+                if p.is_locked:
+                    locked_count += 1
+                else:
+                    active_count += 1
+                    pair_cost_sum += p.pair_cost
+
+            conditions.active_positions = active_count
+            conditions.locked_positions = locked_count
 
             # Pair cost moyen des positions actives
-            if active:
-                conditions.avg_pair_cost = sum(p.pair_cost for p in active) / len(active)
-
-        # Volatilité externe (CoinGecko)
-        conditions.volatility_score = await self._get_volatility_score()
-
-        conditions.timestamp = datetime.now()
-        return conditions
+            if active_count:
+                conditions.avg_pair_cost = pair_cost_sum / active_count
 
     async def _get_volatility_score(self) -> float:
-        """Récupère le score de volatilité depuis CoinGecko (client persistent)."""
+        """Récupère le score de volatilité depuis CoinGecko (client persistent, cache 5 min)."""
+        now = time.monotonic()
+        if now < self._vol_cache_expiry:
+            return self._vol_cache_value
+
         try:
             # Initialiser le client une seule fois
             if not self._cg_client_initialized:
                 from api.public.coingecko_client import CoinGeckoClient
-                self._cg_client = CoinGeckoClient()
+                self._cg_client = CoinGeckoClient(timeout=self._vol_fetch_timeout)
                 await self._cg_client.__aenter__()
                 self._cg_client_initialized = True
 
             if self._cg_client:
-                ranking = await self._cg_client.get_volatility_ranking()
+                # Timeout court: un CoinGecko lent ne doit pas étirer la boucle de 5s
+                ranking = await asyncio.wait_for(
+                    self._cg_client.get_volatility_ranking(),
+                    timeout=self._vol_fetch_timeout
+                )
                 if ranking:
                     # Moyenne des scores de volatilité
                     scores = [score for _, score in ranking]
-                    return sum(scores) / len(scores) if scores else 50.0
+                    self._vol_cache_value = sum(scores) / len(scores)
+                    self._vol_cache_expiry = now + self._vol_cache_ttl
+                    return self._vol_cache_value
 
-        except Exception as e:
-            # Ne pas spammer les logs - juste retourner la valeur par défaut
+        except Exception:
+            # Ne pas spammer les logs
             pass
 
-        return 50.0  # Valeur par défaut
+        # Échec ou classement vide: pas de nouvel appel avant le backoff, et on
+        # garde la dernière valeur valide (50.0 tant que rien n'a été récupéré)
+        self._vol_cache_expiry = now + self._vol_retry_delay
+        return self._vol_cache_value
 
     # ═══════════════════════════════════════════════════════════════
     # CALCUL DES PARAMÈTRES OPTIMAUX
     # ═══════════════════════════════════════════════════════════════
 
+    async def _compute_params(self, conditions: MarketConditions) -> OptimizedParams:
+        """
+        Calcule les paramètres optimaux sans affamer l'event loop.
+
+        Le premier calcul est chronométré: s'il dépasse le seuil, les suivants
+        passent par un worker unique (pas de contention GIL entre threads).
+        """
+        if self._compute_offload:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._compute_executor, self._compute_optimal_params, conditions
+            )
+
+        start = time.perf_counter()
+        params = self._compute_optimal_params(conditions)
+
+        if self._compute_offload is None:
+            self._compute_offload = time.perf_counter() - start > self._compute_offload_threshold
+            if self._compute_offload:
+                self._compute_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="optimizer"
+                )
+
+        return params
+
     def _compute_optimal_params(self, conditions: MarketConditions) -> OptimizedParams:
         """Calcule les paramètres optimaux basés sur les conditions."""
+        # Conditions quasi identiques → même résultat: un hash au lieu de 6 cascades
+        key = _conditions_key(conditions)
+        cached = self._params_cache.get(key)
+        if cached is not None:
+            self._params_cache.move_to_end(key)
+            return cached
+
         params = OptimizedParams()
 
         params.max_pair_cost = self._optimize_max_pair_cost(conditions)
@@ -319,6 +588,10 @@ class AutoOptimizer:
         params.first_buy_threshold = self._optimize_first_buy_threshold(conditions)
         params.refresh_interval = self._optimize_refresh_interval(conditions)
 
+        self._params_cache[key] = params
+        if len(self._params_cache) > self._params_cache_size:
+            self._params_cache.popitem(last=False)
+
         return params
 
     def _optimize_max_pair_cost(self, conditions: MarketConditions) -> float:
@@ -329,21 +602,9 @@ class AutoOptimizer:
         - Spread serré → accepter moins (0.98)
         - Haute volatilité → plus conservateur (-0.02)
         """
-        base = 0.95
-
-        # Ajuster selon spread
-        if conditions.avg_spread > 0.15:
-            base = 0.92  # Gros spread = plus de marge possible
-        elif conditions.avg_spread > 0.10:
-            base = 0.94
-        elif conditions.avg_spread < 0.06:
-            base = 0.98  # Spread serré = accepter moins
-
-        # Ajuster selon volatilité
-        if conditions.volatility_score > 70:
-            base -= 0.02  # Plus conservateur en haute vol
-        elif conditions.volatility_score < 30:
-            base += 0.01  # Plus agressif en basse vol
+        # Ajuster selon spread puis selon volatilité
+        base = _MAXPC_VALUES[bisect_left(_MAXPC_SPREAD_EDGES, conditions.avg_spread)]
+        base += _MAXPC_VOL_ADJ[bisect_left(_MAXPC_VOL_EDGES, conditions.volatility_score)]
 
         return max(0.90, min(0.99, base))
 
@@ -359,15 +620,8 @@ class AutoOptimizer:
         if conditions.active_positions == 0:
             return 0.0
 
-        # Selon le pair_cost moyen
-        if conditions.avg_pair_cost > 0.98:
-            return 0.001  # Besoin d'améliorer rapidement
-        elif conditions.avg_pair_cost > 0.96:
-            return 0.002
-        elif conditions.avg_pair_cost > 0.94:
-            return 0.005  # Standard
-        else:
-            return 0.008  # Déjà bon, être strict
+        # Selon le pair_cost moyen (élevé → flexible, bas → strict)
+        return _MINIMP_VALUES[bisect_left(_MINIMP_PAIR_COST_EDGES, conditions.avg_pair_cost)]
 
     def _optimize_order_size(self, conditions: MarketConditions) -> float:
         """
@@ -377,17 +631,8 @@ class AutoOptimizer:
         - Basse liquidité → ordres plus petits
         - Positions proches du lock → boost
         """
-        base = 25.0
-
         # Scaling selon liquidité
-        if conditions.avg_liquidity > 100000:
-            base = 75.0
-        elif conditions.avg_liquidity > 50000:
-            base = 50.0
-        elif conditions.avg_liquidity > 20000:
-            base = 35.0
-        elif conditions.avg_liquidity < 10000:
-            base = 15.0
+        base = _ORDER_SIZE_VALUES[bisect_left(_ORDER_SIZE_LIQ_EDGES, conditions.avg_liquidity)]
 
         # Boost si positions proches du lock
         if conditions.avg_pair_cost < 0.96 and conditions.active_positions > 0:
@@ -402,15 +647,8 @@ class AutoOptimizer:
         - Haute liquidité → positions plus grandes
         - Beaucoup de positions actives → réduire pour diversifier
         """
-        base = 500.0
-
         # Scaling selon liquidité
-        if conditions.avg_liquidity > 100000:
-            base = 1000.0
-        elif conditions.avg_liquidity > 50000:
-            base = 750.0
-        elif conditions.avg_liquidity < 20000:
-            base = 300.0
+        base = _MAX_POS_VALUES[bisect_left(_MAX_POS_LIQ_EDGES, conditions.avg_liquidity)]
 
         # Réduire si beaucoup de positions actives
         if conditions.active_positions > 5:
@@ -426,19 +664,9 @@ class AutoOptimizer:
         - Haute volatilité → plus agressif (0.50)
         - Normal → équilibré (0.55)
         """
-        base = 0.55
-
-        # Plus agressif avec gros spread
-        if conditions.avg_spread > 0.12:
-            base = 0.50
-        elif conditions.avg_spread < 0.06:
-            base = 0.60  # Plus conservateur avec spread serré
-
-        # Plus agressif en haute volatilité
-        if conditions.volatility_score > 70:
-            base -= 0.05
-        elif conditions.volatility_score < 30:
-            base += 0.05
+        # Plus agressif avec gros spread / en haute volatilité
+        base = _FIRST_BUY_VALUES[bisect_left(_FIRST_BUY_SPREAD_EDGES, conditions.avg_spread)]
+        base += _FIRST_BUY_VOL_ADJ[bisect_left(_FIRST_BUY_VOL_EDGES, conditions.volatility_score)]
 
         return max(0.45, min(0.65, base))
 
@@ -472,6 +700,15 @@ class AutoOptimizer:
     # APPLICATION DES PARAMÈTRES
     # ═══════════════════════════════════════════════════════════════
 
+    def _bind_capabilities(self, config) -> None:
+        """Calcule les paramètres supportés par la config (évite hasattr par appel)."""
+        if config is self._caps_config:
+            return
+        self._caps_config = config
+        self._apply_spec = tuple(spec for spec in _APPLY_SPEC if hasattr(config, spec[0]))
+        self._suggestable = frozenset(name for name in _OPTIMIZED_FIELDS if hasattr(config, name))
+        self._has_first_buy = hasattr(config, "first_buy_threshold")
+
     def _apply_params(self, params: OptimizedParams) -> List[str]:
         """
         Applique les paramètres optimisés au GabagoolEngine.
@@ -483,60 +720,25 @@ class AutoOptimizer:
 
         changes = []
         config = self.gabagool.config
+        self._bind_capabilities(config)
+        now = self._tick_now
 
-        # Seuil de changement significatif
-        THRESHOLD = 0.01  # 1% de changement
-
-        # max_pair_cost
-        if abs(config.max_pair_cost - params.max_pair_cost) / config.max_pair_cost > THRESHOLD:
-            old = config.max_pair_cost
-            config.max_pair_cost = params.max_pair_cost
-            changes.append(f"max_pair_cost: {old:.3f} → {params.max_pair_cost:.3f}")
-            self._log_event("max_pair_cost", old, params.max_pair_cost, "spread/volatility")
-
-        # min_improvement - vérifier qu'il y a un changement réel
-        min_imp_changed = False
-        if config.min_improvement == 0 and params.min_improvement > 0:
-            min_imp_changed = True
-        elif config.min_improvement > 0 and params.min_improvement == 0:
-            min_imp_changed = True
-        elif config.min_improvement > 0 and abs(config.min_improvement - params.min_improvement) / config.min_improvement > THRESHOLD:
-            min_imp_changed = True
-
-        if min_imp_changed:
-            old = config.min_improvement
-            config.min_improvement = params.min_improvement
-            changes.append(f"min_improvement: {old:.4f} → {params.min_improvement:.4f}")
-            self._log_event("min_improvement", old, params.min_improvement, "position_state")
-
-        # order_size_usd
-        if abs(config.order_size_usd - params.order_size_usd) / config.order_size_usd > THRESHOLD:
-            old = config.order_size_usd
-            config.order_size_usd = params.order_size_usd
-            changes.append(f"order_size_usd: ${old:.0f} → ${params.order_size_usd:.0f}")
-            self._log_event("order_size_usd", old, params.order_size_usd, "liquidity")
-
-        # max_position_usd
-        if abs(config.max_position_usd - params.max_position_usd) / config.max_position_usd > THRESHOLD:
-            old = config.max_position_usd
-            config.max_position_usd = params.max_position_usd
-            changes.append(f"max_position_usd: ${old:.0f} → ${params.max_position_usd:.0f}")
-            self._log_event("max_position_usd", old, params.max_position_usd, "liquidity/diversification")
-
-        # first_buy_threshold (si disponible dans config)
-        if hasattr(config, 'first_buy_threshold'):
-            if abs(config.first_buy_threshold - params.first_buy_threshold) / config.first_buy_threshold > THRESHOLD:
-                old = config.first_buy_threshold
-                config.first_buy_threshold = params.first_buy_threshold
-                changes.append(f"first_buy_threshold: {old:.3f} → {params.first_buy_threshold:.3f}")
-                self._log_event("first_buy_threshold", old, params.first_buy_threshold, "spread")
+        for name, reason, fmt, zero_significant in self._apply_spec:
+            old = getattr(config, name)
+            new = getattr(params, name)
+            if _param_changed(old, new, zero_significant):
+                setattr(config, name, new)
+                changes.append(f"{name}: {fmt.format(old)} → {fmt.format(new)}")
+                self._log_event(name, old, new, reason, now)
 
         # Log si changements
         if changes:
             self._total_adjustments += len(changes)
-            print(f"⚡ [Optimizer] Paramètres mis à jour:")
-            for change in changes:
-                print(f"   • {change}")
+            if log.isEnabledFor(logging.INFO):
+                log.info(
+                    "⚡ [Optimizer] Paramètres mis à jour:\n%s",
+                    "\n".join(f"   • {change}" for change in changes)
+                )
 
             # Callback
             if self.on_params_updated:
@@ -544,20 +746,24 @@ class AutoOptimizer:
 
         return changes
 
-    def _log_event(self, param: str, old: float, new: float, reason: str) -> None:
-        """Enregistre un événement de modification."""
+    def _log_event(
+        self,
+        param: str,
+        old: float,
+        new: float,
+        reason: str,
+        timestamp: Optional[datetime] = None
+    ) -> None:
+        """Enregistre un événement de modification (timestamp du tick si fourni)."""
         event = OptimizationEvent(
-            timestamp=datetime.now(),
+            timestamp=timestamp or datetime.now(),
             param_name=param,
             old_value=old,
             new_value=new,
             reason=reason
         )
         self._events.append(event)
-
-        # Garder seulement les 100 derniers événements
-        if len(self._events) > 100:
-            self._events = self._events[-100:]
+        self._recent_dirty = True
 
     # ═══════════════════════════════════════════════════════════════
     # SUGGESTIONS (MODE SEMI-AUTO)
@@ -572,17 +778,19 @@ class AutoOptimizer:
         if not self._conditions:
             return {}
 
-        current = {}
+        # Snapshot des valeurs courantes (la config peut être modifiée hors optimiseur)
+        snapshot = ()
         if self.gabagool:
             config = self.gabagool.config
-            current = {
-                "max_pair_cost": config.max_pair_cost,
-                "min_improvement": config.min_improvement,
-                "order_size_usd": config.order_size_usd,
-                "max_position_usd": config.max_position_usd,
-            }
+            snapshot = tuple(getattr(config, key) for key in _SUGGESTION_KEYS)
 
-        suggested = self._current_params.to_dict()
+        if (snapshot == self._suggestions_snapshot
+                and self._current_params is self._suggestions_params
+                and self._conditions is self._suggestions_conditions):
+            return self._copy_suggestions()
+
+        current = dict(zip(_SUGGESTION_KEYS, snapshot))
+        suggested = self._optimized_dict
 
         # Calculer les différences
         suggestions = []
@@ -598,35 +806,49 @@ class AutoOptimizer:
                         "direction": "↑" if diff > 0 else "↓"
                     })
 
-        return {
+        conditions = self._conditions_dict
+        self._suggestions_cache = {
             "conditions": {
-                "avg_spread": round(self._conditions.avg_spread, 4),
-                "avg_liquidity": round(self._conditions.avg_liquidity, 0),
-                "volatility_score": round(self._conditions.volatility_score, 1),
-                "active_positions": self._conditions.active_positions,
-                "ws_connected": self._conditions.ws_connected,
+                "avg_spread": conditions["avg_spread"],
+                "avg_liquidity": conditions["avg_liquidity"],
+                "volatility_score": conditions["volatility_score"],
+                "active_positions": conditions["active_positions"],
+                "ws_connected": conditions["ws_connected"],
             },
             "suggestions": suggestions,
             "timestamp": self._conditions.timestamp.isoformat()
         }
+        self._suggestions_snapshot = snapshot
+        self._suggestions_params = self._current_params
+        self._suggestions_conditions = self._conditions
+        return self._copy_suggestions()
+
+    def _copy_suggestions(self) -> dict:
+        """Copie du cache de suggestions (l'appelant peut la modifier sans effet de bord)."""
+        cache = self._suggestions_cache
+        return {
+            "conditions": dict(cache["conditions"]),
+            "suggestions": [dict(s) for s in cache["suggestions"]],
+            "timestamp": cache["timestamp"],
+        }
 
     def apply_suggestion(self, param_name: str) -> bool:
         """Applique une suggestion spécifique."""
-        if not self.gabagool or not hasattr(self._current_params, param_name):
+        if not self.gabagool:
             return False
 
-        new_value = getattr(self._current_params, param_name)
         config = self.gabagool.config
+        self._bind_capabilities(config)
+        if param_name not in self._suggestable:
+            return False
 
-        if hasattr(config, param_name):
-            old_value = getattr(config, param_name)
-            setattr(config, param_name, new_value)
-            self._log_event(param_name, old_value, new_value, "manual_apply")
-            self._total_adjustments += 1
-            print(f"✅ [Optimizer] Suggestion appliquée: {param_name} = {new_value}")
-            return True
-
-        return False
+        new_value = getattr(self._current_params, param_name)
+        old_value = getattr(config, param_name)
+        setattr(config, param_name, new_value)
+        self._log_event(param_name, old_value, new_value, "manual_apply")
+        self._total_adjustments += 1
+        log.info("✅ [Optimizer] Suggestion appliquée: %s = %s", param_name, new_value)
+        return True
 
     # ═══════════════════════════════════════════════════════════════
     # STATUS
@@ -643,22 +865,10 @@ class AutoOptimizer:
                 "order_size_usd": config.order_size_usd,
                 "max_position_usd": config.max_position_usd,
             }
-            if hasattr(config, 'first_buy_threshold'):
+            self._bind_capabilities(config)
+            if self._has_first_buy:
                 current_params["first_buy_threshold"] = config.first_buy_threshold
 
-        conditions_dict = {}
-        if self._conditions:
-            conditions_dict = {
-                "avg_spread": round(self._conditions.avg_spread, 4),
-                "avg_volume": round(self._conditions.avg_volume, 0),
-                "avg_liquidity": round(self._conditions.avg_liquidity, 0),
-                "volatility_score": round(self._conditions.volatility_score, 1),
-                "active_positions": self._conditions.active_positions,
-                "locked_positions": self._conditions.locked_positions,
-                "avg_pair_cost": round(self._conditions.avg_pair_cost, 4),
-                "ws_connected": self._conditions.ws_connected,
-            }
-
         return {
             "enabled": self._enabled,
             "mode": self.mode.value,
@@ -666,16 +876,8 @@ class AutoOptimizer:
             "last_update": self._last_update.isoformat() if self._last_update else None,
             "total_adjustments": self._total_adjustments,
             "current_params": current_params,
-            "optimized_params": self._current_params.to_dict(),
-            "conditions": conditions_dict,
-            "recent_events": [
-                {
-                    "timestamp": e.timestamp.isoformat(),
-                    "param": e.param_name,
-                    "old": e.old_value,
-                    "new": e.new_value,
-                    "reason": e.reason
-                }
-                for e in self.recent_events
-            ]
+            # Copies: le payload peut être modifié par l'appelant (web/UI)
+            "optimized_params": dict(self._optimized_dict),
+            "conditions": dict(self._conditions_dict),
+            "recent_events": [e.to_dict() for e in self.recent_events]
         }
@@ -10,6 +10,8 @@ Fonctionnalités:
 """
 
 import asyncio
+import contextlib
+import time
 from typing import Optional, Callable
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -22,6 +24,25 @@ from api.private.polymarket_private import OrderSide
 from config import get_settings, get_trading_params, TradingParams
 
 
+# Nombre de locks (puissance de 2) partagés entre tous les marchés
+_MARKET_LOCK_STRIPES = 64
+
+# Côté des deux legs bilatéraux (résolu une fois)
+_BUY = OrderSide.BUY.value
+
+# Cache négatif des marchés qui refusent les ordres (fermés, inconnus...)
+_HALTED_TTL = 30.0          # Secondes avant de retenter le marché
+_HALTED_MAX_ENTRIES = 1024  # Éviction FIFO au-delà
+_HALTED_ERROR_MARKERS = (
+    "market not found",
+    "invalid market",
+    "market is closed",
+    "market closed",
+    "not accepting orders",
+    "orderbook does not exist",
+)
+
+
 class ExecutorState(Enum):
     """États de l'executor."""
     STOPPED = "stopped"
@@ -30,7 +51,11 @@ class ExecutorState(Enum):
     PAUSED = "paused"
 
 
-@dataclass
+# États qui bloquent le trading (tuple module: pas de lookup sur la classe Enum)
+_BLOCKED_STATES = (ExecutorState.STOPPED, ExecutorState.PAUSED)
+
+
+@dataclass(slots=True)
 class TradeResult:
     """Résultat d'un trade."""
     opportunity_id: str
@@ -67,24 +92,40 @@ class OrderExecutor:
         self._order_manager = order_manager or OrderManager()
         
         self._state = ExecutorState.STOPPED
+        self._ready = False  # État READY + credentials, maintenu à chaque changement
         self._client: Optional[PolymarketPrivateClient] = None
+        self._place_batch: Optional[Callable] = None  # Méthode liée du client, fixée au start
+        # Cycle de vie du client (une pile par executor)
+        self._stack = contextlib.AsyncExitStack()
 
         # Stats
         self._trades_today = 0
         self._successful_trades = 0
         self._failed_trades = 0
-        self._last_trade_time: Optional[datetime] = None
+        self._win_rate = 0.0  # Mis à jour à chaque trade, pas à chaque lecture
+        self._last_trade_time: Optional[datetime] = None  # Pour les stats uniquement
+        self._last_trade_time_iso: Optional[str] = None
+        self._next_trade_allowed_at = 0.0  # Deadline monotonic du prochain trade
+        self._inflight = 0  # Trades en cours (tous marchés confondus)
+        # Réservations des trades admis mais pas encore terminés, comptées
+        # dans les limites: l'admission ne dépend pas d'un snapshot périmé
+        self._reserved_slots = 0
+        self._reserved_exposure = 0.0
+        self._halted: dict[str, float] = {}  # market_id -> expiration (monotonic)
 
         # 5.2: Locks par marché (au lieu d'un lock global)
-        # Permet des trades parallèles sur différents marchés
-        from typing import Dict
-        self._market_locks: Dict[str, asyncio.Lock] = {}
+        # Permet des trades parallèles sur différents marchés.
+        # Locks striés: mémoire fixe quel que soit le nombre de marchés vus
+        self._market_locks: tuple[asyncio.Lock, ...] = tuple(
+            asyncio.Lock() for _ in range(_MARKET_LOCK_STRIPES)
+        )
         
         # Callbacks
         self.on_trade_start: Optional[Callable[[Opportunity], None]] = None
         self.on_trade_success: Optional[Callable[[TradeResult], None]] = None
         self.on_trade_failure: Optional[Callable[[TradeResult], None]] = None
         self.on_state_change: Optional[Callable[[ExecutorState], None]] = None
+        self._callback_tasks: set[asyncio.Task] = set()  # Callbacks async en cours
     
     @property
     def state(self) -> ExecutorState:
@@ -94,7 +135,7 @@ class OrderExecutor:
     @property
     def is_ready(self) -> bool:
         """Vérifie si l'executor est prêt à trader."""
-        return self._state == ExecutorState.READY and self._credentials is not None
+        return self._ready
     
     @property
     def stats(self) -> dict:
@@ -103,13 +144,15 @@ class OrderExecutor:
             "trades_today": self._trades_today,
             "successful": self._successful_trades,
             "failed": self._failed_trades,
-            "win_rate": self._successful_trades / max(1, self._trades_today) * 100,
-            "last_trade": self._last_trade_time.isoformat() if self._last_trade_time else None,
+            "win_rate": self._win_rate,
+            "last_trade": self._last_trade_time_iso,
+            "in_flight": self._inflight,
         }
     
     def set_credentials(self, credentials: PolymarketCredentials) -> None:
         """Configure les credentials."""
         self._credentials = credentials
+        self._ready = self._state is ExecutorState.READY and credentials is not None
     
     def update_params(self, params: TradingParams) -> None:
         """Met à jour les paramètres de trading."""
@@ -118,9 +161,26 @@ class OrderExecutor:
     def _set_state(self, state: ExecutorState) -> None:
         """Change l'état."""
         self._state = state
+        self._ready = state is ExecutorState.READY and self._credentials is not None
         if self.on_state_change:
             self.on_state_change(state)
     
+    def _dispatch(self, callback: Optional[Callable], arg) -> None:
+        """
+        Planifie un callback utilisateur sans l'exécuter sur le chemin critique.
+
+        Le callback tourne à la prochaine itération de la boucle, donc
+        après la libération du lock de marché.
+        """
+        if callback is None:
+            return
+        if asyncio.iscoroutinefunction(callback):
+            task = asyncio.create_task(callback(arg))
+            self._callback_tasks.add(task)
+            task.add_done_callback(self._callback_tasks.discard)
+        else:
+            asyncio.get_running_loop().call_soon(callback, arg)
+
     async def start(self) -> bool:
         """
         Démarre l'executor.
@@ -132,19 +192,26 @@ class OrderExecutor:
             return False
         
         try:
-            self._client = PolymarketPrivateClient(self._credentials)
-            await self._client.__aenter__()
+            self._client = await self._stack.enter_async_context(
+                PolymarketPrivateClient(self._credentials)
+            )
+            self._place_batch = self._client.place_orders_batch
+            # Connexion HTTPS/TLS ouverte avant le premier trade
+            await self._client.prime_connection()
             self._set_state(ExecutorState.READY)
             return True
         except Exception as e:
+            await self._stack.aclose()
+            self._client = None
+            self._place_batch = None
             self._set_state(ExecutorState.STOPPED)
             return False
     
     async def stop(self) -> None:
         """Arrête l'executor."""
-        if self._client:
-            await self._client.__aexit__(None, None, None)
-            self._client = None
+        await self._stack.aclose()
+        self._client = None
+        self._place_batch = None
         self._set_state(ExecutorState.STOPPED)
     
     def pause(self) -> None:
@@ -157,45 +224,102 @@ class OrderExecutor:
         if self._state == ExecutorState.PAUSED:
             self._set_state(ExecutorState.READY)
     
-    async def can_trade(self) -> tuple[bool, str]:
+    def _fast_reject(self) -> Optional[str]:
         """
-        Vérifie si on peut trader maintenant.
+        Vérifications globales O(1), sans lock.
         
         Returns:
-            Tuple (peut_trader, raison si non)
+            Raison du refus, ou None si le trade est possible
         """
-        # Vérifier l'état
-        if self._state != ExecutorState.READY:
-            return False, f"Executor non prêt (état: {self._state.value})"
+        params = self._params
+        order_manager = self._order_manager
+        state = self._state
+
+        # Vérifier l'état (plusieurs trades peuvent être en cours en parallèle)
+        if state in _BLOCKED_STATES:
+            return f"Executor non prêt (état: {state.value})"
         
         # Vérifier le trading automatique
-        if not self._params.auto_trading_enabled:
-            return False, "Trading automatique désactivé"
+        if not params.auto_trading_enabled:
+            return "Trading automatique désactivé"
         
         # Vérifier le délai entre trades
-        if self._last_trade_time:
-            elapsed = (datetime.now() - self._last_trade_time).total_seconds()
-            if elapsed < self._params.min_time_between_trades:
-                remaining = self._params.min_time_between_trades - elapsed
-                return False, f"Attendre {remaining:.0f}s avant prochain trade"
+        remaining = self._next_trade_allowed_at - time.monotonic()
+        if remaining > 0:
+            return f"Attendre {remaining:.0f}s avant prochain trade"
+        
+        # Vérifier le nombre de positions ouvertes (+ trades admis en cours)
+        open_positions = order_manager.open_positions_count + self._reserved_slots
+        max_open_positions = params.max_open_positions
+        if open_positions >= max_open_positions:
+            return f"Limite de positions atteinte ({open_positions}/{max_open_positions})"
+        
+        # Vérifier l'exposition totale (+ capital réservé par les trades en cours)
+        current_exposure = order_manager.total_exposure + self._reserved_exposure
+        max_total_exposure = params.max_total_exposure
+        if current_exposure + params.capital_per_trade > max_total_exposure:
+            return f"Exposition max atteinte (${current_exposure:.2f}/${max_total_exposure:.2f})"
         
-        # Vérifier le nombre de positions ouvertes
-        open_positions = self._order_manager.open_positions_count
-        if open_positions >= self._params.max_open_positions:
-            return False, f"Limite de positions atteinte ({open_positions}/{self._params.max_open_positions})"
+        return None
+    
+    def _reserve(self) -> Optional[str]:
+        """
+        Admet un trade: vérifie les limites et réserve atomiquement (aucun
+        await) une place, le capital et le créneau de cooldown.
         
-        # Vérifier l'exposition totale
-        current_exposure = self._order_manager.total_exposure
-        if current_exposure + self._params.capital_per_trade > self._params.max_total_exposure:
-            return False, f"Exposition max atteinte (${current_exposure:.2f}/${self._params.max_total_exposure:.2f})"
+        Returns:
+            Raison du refus, ou None si réservé (à libérer par _release)
+        """
+        reason = self._fast_reject()
+        if reason is None:
+            params = self._params
+            self._reserved_slots += 1
+            self._reserved_exposure += params.capital_per_trade
+            self._next_trade_allowed_at = time.monotonic() + params.min_time_between_trades
+        return reason
+    
+    def _release(self, capital: float) -> None:
+        """Libère la réservation d'un trade terminé."""
+        self._reserved_slots -= 1
+        # Remise à zéro exacte quand plus rien n'est réservé (pas de dérive flottante)
+        self._reserved_exposure = self._reserved_exposure - capital if self._reserved_slots else 0.0
+    
+    async def can_trade(self) -> tuple[bool, str]:
+        """
+        Vérifie si on peut trader maintenant.
         
+        Returns:
+            Tuple (peut_trader, raison si non)
+        """
+        reason = self._fast_reject()
+        if reason is not None:
+            return False, reason
         return True, ""
     
+    def _is_halted(self, market_id: str) -> bool:
+        """Vérifie si le marché est dans le cache négatif (et purge si expiré)."""
+        expires_at = self._halted.get(market_id)
+        if expires_at is None:
+            return False
+        if time.monotonic() < expires_at:
+            return True
+        del self._halted[market_id]
+        return False
+    
+    def _mark_halted(self, market_id: str, error: Exception) -> None:
+        """Met le marché en cache négatif si l'erreur indique qu'il refuse les ordres."""
+        message = str(error).lower()
+        if not any(marker in message for marker in _HALTED_ERROR_MARKERS):
+            return
+        halted = self._halted
+        halted.pop(market_id, None)
+        if len(halted) >= _HALTED_MAX_ENTRIES:
+            del halted[next(iter(halted))]  # FIFO: la plus ancienne entrée
+        halted[market_id] = time.monotonic() + _HALTED_TTL
+    
     def _get_market_lock(self, market_id: str) -> asyncio.Lock:
-        """5.2: Récupère ou crée un lock pour un marché spécifique."""
-        if market_id not in self._market_locks:
-            self._market_locks[market_id] = asyncio.Lock()
-        return self._market_locks[market_id]
+        """5.2: Récupère le lock (strié) associé à un marché."""
+        return self._market_locks[hash(market_id) & (_MARKET_LOCK_STRIPES - 1)]
 
     async def execute_opportunity(self, opportunity: Opportunity) -> TradeResult:
         """
@@ -207,61 +331,160 @@ class OrderExecutor:
         Returns:
             TradeResult avec les détails du trade
         """
+        # Refus globaux (état, cooldown, limites) avant tout passage par le lock
+        reason = self._fast_reject()
+        if reason is None and self._is_halted(opportunity.market_id):
+            reason = "Marché suspendu (ordres refusés récemment)"
+        if reason is not None:
+            return TradeResult(
+                opportunity_id=opportunity.id,
+                success=False,
+                error_message=reason
+            )
+        
         # 5.2: Lock par marché - permet des trades parallèles sur différents marchés
         market_lock = self._get_market_lock(opportunity.market_id)
         async with market_lock:
-            self._set_state(ExecutorState.EXECUTING)
+            # Vérifier l'opportunité
+            if opportunity.action != OpportunityAction.TRADE:
+                return TradeResult(
+                    opportunity_id=opportunity.id,
+                    success=False,
+                    error_message="Opportunité non éligible au trading"
+                )
+            
+            # Re-vérifier sous le lock et réserver (positions/exposition/cooldown
+            # partagés avec les trades en cours sur les autres marchés)
+            capital = self._params.capital_per_trade
+            reason = self._reserve()
+            if reason is not None:
+                return TradeResult(
+                    opportunity_id=opportunity.id,
+                    success=False,
+                    error_message=reason
+                )
             
             try:
-                # Vérifier si on peut trader
-                can_trade, reason = await self.can_trade()
-                if not can_trade:
-                    return TradeResult(
-                        opportunity_id=opportunity.id,
-                        success=False,
-                        error_message=reason
-                    )
-                
-                # Vérifier l'opportunité
-                if opportunity.action != OpportunityAction.TRADE:
-                    return TradeResult(
-                        opportunity_id=opportunity.id,
-                        success=False,
-                        error_message="Opportunité non éligible au trading"
-                    )
-                
-                # Callback de début
-                if self.on_trade_start:
-                    self.on_trade_start(opportunity)
-                
                 # Calculer la taille des ordres
                 size = self._calculate_order_size(opportunity)
                 
-                # Placer les ordres
-                result = await self._place_bilateral_orders(opportunity, size)
-                
-                # Mettre à jour les stats
-                self._trades_today += 1
-                self._last_trade_time = datetime.now()
-                
-                if result.success:
-                    self._successful_trades += 1
-                    if self.on_trade_success:
-                        self.on_trade_success(result)
-                else:
-                    self._failed_trades += 1
-                    if self.on_trade_failure:
-                        self.on_trade_failure(result)
-                
-                return result
-                
+                return await self._run_trade(opportunity, size)
             finally:
-                self._set_state(ExecutorState.READY)
+                self._release(capital)
+    
+    async def execute_opportunities(self, opportunities: list[Opportunity]) -> list[TradeResult]:
+        """
+        Exécute un lot d'opportunités avec une seule admission.
+        
+        Chaque opportunité est admise dans l'ordre du lot via _reserve
+        (place, exposition et cooldown réservés sur les compteurs partagés,
+        sans await entre vérification et réservation). Les opportunités
+        admises sont ensuite tradées en parallèle. Avec un
+        min_time_between_trades non nul, une seule est admise par lot.
+        
+        Args:
+            opportunities: Opportunités à trader (une seule par marché)
+            
+        Returns:
+            Un TradeResult par opportunité, dans le même ordre
+        """
+        reason = self._fast_reject()
+        if reason is not None:
+            return [
+                TradeResult(opportunity_id=o.id, success=False, error_message=reason)
+                for o in opportunities
+            ]
+        
+        capital = self._params.capital_per_trade
+        results: list[Optional[TradeResult]] = [None] * len(opportunities)
+        admitted: list[tuple[int, Opportunity, float]] = []
+        markets: set[str] = set()
+        
+        for index, opportunity in enumerate(opportunities):
+            if opportunity.action != OpportunityAction.TRADE:
+                error = "Opportunité non éligible au trading"
+            elif opportunity.market_id in markets:
+                error = "Marché déjà présent dans le lot"
+            elif self._is_halted(opportunity.market_id):
+                error = "Marché suspendu (ordres refusés récemment)"
+            else:
+                error = self._reserve()
+                if error is None:
+                    markets.add(opportunity.market_id)
+                    admitted.append((index, opportunity, self._calculate_order_size(opportunity)))
+                    continue
+            results[index] = TradeResult(
+                opportunity_id=opportunity.id,
+                success=False,
+                error_message=error
+            )
+        
+        traded = await asyncio.gather(*(
+            self._execute_locked(opportunity, size, capital) for _, opportunity, size in admitted
+        ))
+        for (index, _, _), result in zip(admitted, traded):
+            results[index] = result
+        
+        return results
+    
+    async def _execute_locked(
+        self,
+        opportunity: Opportunity,
+        size: float,
+        capital: float
+    ) -> TradeResult:
+        """Trade une opportunité déjà admise (réservée) sous le lock de son marché."""
+        try:
+            async with self._get_market_lock(opportunity.market_id):
+                return await self._run_trade(opportunity, size)
+        finally:
+            self._release(capital)
+    
+    async def _run_trade(self, opportunity: Opportunity, size: float) -> TradeResult:
+        """Place les ordres et met à jour les stats (appelé sous le lock du marché)."""
+        # Pas de bascule d'état global: les trades sur d'autres marchés
+        # tournent en parallèle, on compte juste les trades en cours
+        self._inflight += 1
+        try:
+            # Callback de début (différé, ne bloque pas le lock)
+            self._dispatch(self.on_trade_start, opportunity)
+            
+            # Placer les ordres
+            result = await self._place_bilateral_orders(opportunity, size)
+            
+            # Mettre à jour les stats
+            self._trades_today += 1
+            self._last_trade_time = datetime.now()
+            self._last_trade_time_iso = self._last_trade_time.isoformat()
+            self._next_trade_allowed_at = time.monotonic() + self._params.min_time_between_trades
+            
+            if result.success:
+                self._successful_trades += 1
+                self._dispatch(self.on_trade_success, result)
+            else:
+                self._failed_trades += 1
+                self._dispatch(self.on_trade_failure, result)
+            self._win_rate = self._successful_trades * 100.0 / self._trades_today
+            
+            return result
+            
+        finally:
+            self._inflight -= 1
     
     def _calculate_order_size(self, opportunity: Opportunity) -> float:
         """
         Calcule la taille optimale des ordres.
         
+        Utilise la taille pré-calculée par l'analyzer si disponible.
+        """
+        if opportunity.size is not None:
+            return opportunity.size
+        return self._fallback_size(opportunity)
+    
+    def _fallback_size(self, opportunity: Opportunity) -> float:
+        """
+        Calcule la taille des ordres à partir des paramètres de l'executor.
+        
         Basé sur:
         - Capital alloué par trade
         - Prix des tokens
@@ -295,7 +518,8 @@ class OrderExecutor:
         Returns:
             TradeResult
         """
-        if not self._client:
+        place_batch = self._place_batch
+        if place_batch is None:
             return TradeResult(
                 opportunity_id=opportunity.id,
                 success=False,
@@ -304,40 +528,40 @@ class OrderExecutor:
         
         order_yes_id = None
         order_no_id = None
+        timeout = self._params.order_post_timeout_s
 
         try:
-            # 5.1: Exécution PARALLÈLE des ordres YES et NO (50% latence gagnée)
-            results = await asyncio.gather(
-                self._client.place_order(
-                    token_id=opportunity.token_yes_id,
-                    side=OrderSide.BUY,
-                    price=opportunity.recommended_price_yes,
-                    size=size
-                ),
-                self._client.place_order(
-                    token_id=opportunity.token_no_id,
-                    side=OrderSide.BUY,
-                    price=opportunity.recommended_price_no,
-                    size=size
-                ),
-                return_exceptions=True  # Capturer les erreurs individuellement
-            )
+            # Les deux legs partent dans une seule requête batch (un aller-retour),
+            # avec un budget de latence sur le POST (signature exclue)
+            order_yes, order_no = await place_batch([
+                {
+                    "token_id": opportunity.token_yes_id,
+                    "side": _BUY,
+                    "price": opportunity.recommended_price_yes,
+                    "size": size,
+                },
+                {
+                    "token_id": opportunity.token_no_id,
+                    "side": _BUY,
+                    "price": opportunity.recommended_price_no,
+                    "size": size,
+                },
+            ], post_timeout=timeout)
 
-            order_yes, order_no = results
+            order_yes_id = order_yes.get("id") or order_yes.get("orderID")
+            order_no_id = order_no.get("id") or order_no.get("orderID")
 
-            # Traiter résultat YES
-            if isinstance(order_yes, Exception):
-                raise order_yes  # Propager l'erreur
-            order_yes_id = order_yes.get("id")
+            # Chaque leg est accepté ou rejeté indépendamment par le CLOB
+            if not order_yes_id or not order_no_id:
+                raise RuntimeError(
+                    order_yes.get("error") or order_yes.get("errorMsg")
+                    or order_no.get("error") or order_no.get("errorMsg")
+                    or "Ordre rejeté par le batch"
+                )
 
-            # Traiter résultat NO
-            if isinstance(order_no, Exception):
-                raise order_no  # Propager l'erreur
-            order_no_id = order_no.get("id")
-            
-            # Enregistrer dans l'order manager
-            if order_yes_id:
-                self._order_manager.add_order(ActiveOrder(
+            # Enregistrer les deux legs dans l'order manager en un appel
+            self._order_manager.add_orders((
+                ActiveOrder(
                     id=order_yes_id,
                     opportunity_id=opportunity.id,
                     market_id=opportunity.market_id,
@@ -346,10 +570,8 @@ class OrderExecutor:
                     price=opportunity.recommended_price_yes,
                     size=size,
                     status="open"
-                ))
-            
-            if order_no_id:
-                self._order_manager.add_order(ActiveOrder(
+                ),
+                ActiveOrder(
                     id=order_no_id,
                     opportunity_id=opportunity.id,
                     market_id=opportunity.market_id,
@@ -358,7 +580,8 @@ class OrderExecutor:
                     price=opportunity.recommended_price_no,
                     size=size,
                     status="open"
-                ))
+                ),
+            ))
             
             return TradeResult(
                 opportunity_id=opportunity.id,
@@ -367,13 +590,26 @@ class OrderExecutor:
                 order_no_id=order_no_id
             )
             
+        except asyncio.TimeoutError:
+            # Le client annule lui-même, par IDs, les ordres que le POST
+            # abandonné finira par créer: jamais d'annulation par token, qui
+            # toucherait les legs d'autres trades et les cotations MM
+            return TradeResult(
+                opportunity_id=opportunity.id,
+                success=False,
+                error_message=f"Timeout soumission des ordres ({timeout:.2f}s)"
+            )
+            
         except Exception as e:
-            # Si un ordre a réussi, essayer de l'annuler
-            if order_yes_id and not order_no_id:
-                try:
-                    await self._client.cancel_order(order_yes_id)
-                except Exception:
-                    pass
+            self._mark_halted(opportunity.market_id, e)
+            
+            # Annuler en parallèle tous les legs acceptés (rollback)
+            accepted = [oid for oid in (order_yes_id, order_no_id) if oid]
+            if accepted:
+                await asyncio.gather(
+                    *(self._client.cancel_order(oid) for oid in accepted),
+                    return_exceptions=True
+                )
             
             return TradeResult(
                 opportunity_id=opportunity.id,
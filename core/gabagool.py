@@ -13,22 +13,114 @@ Formules:
 - profit = min(qty_yes, qty_no) - (cost_yes + cost_no)
 """
 
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Iterable, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from collections import deque
 import asyncio
+import sys
+import time
 
 from api.private import PolymarketPrivate
 
 
+# Seuil de changement de prix (0.5%) sous lequel un marché n'est pas ré-analysé
+PRICE_CHANGE_THRESHOLD = 0.005
+
+# Logs de trades: écrits par lots hors du chemin d'exécution
+LOG_FLUSH_INTERVAL = 0.1  # secondes
+LOG_BUFFER_SIZE = 4096    # lignes max en attente (les plus anciennes sont perdues)
+
+
+# Actions retournées par _decide
+_ACTION_NONE = 0
+_ACTION_YES = 1
+_ACTION_NO = 2
+
+
+def _decide(
+    qty_yes: float,
+    qty_no: float,
+    cost_yes: float,
+    cost_no: float,
+    avg_yes: float,
+    avg_no: float,
+    pair_cost: float,
+    price_yes: float,
+    price_no: float,
+    buy_qty_yes: float,
+    buy_qty_no: float,
+    max_pos: float,
+    max_cost: float,
+    min_improve: float,
+    first_threshold: float,
+) -> int:
+    """
+    Décision YES/NO fusionnée (mêmes règles que should_buy_yes/should_buy_no).
+
+    Fonction module sans état: tous les paramètres sont des floats, la
+    position et la config sont lues une seule fois par l'appelant.
+    Aucune closure ni objet capturé: le noyau peut être compilé tel quel
+    (ex. numba.njit(cache=True)) sans changer l'appelant.
+
+    Returns:
+        _ACTION_NONE, _ACTION_YES ou _ACTION_NO
+    """
+    total_cost = cost_yes + cost_no
+    # Coût ajouté par côté (≈ order_size), calculé une seule fois
+    added_yes = price_yes * buy_qty_yes
+    added_no = price_no * buy_qty_no
+
+    # Côté YES
+    if total_cost + added_yes > max_pos:
+        can_yes = False
+    elif qty_yes == 0:
+        can_yes = price_yes < first_threshold
+    else:
+        if qty_no == 0:
+            new_pair_cost = 1.0
+        else:
+            new_pair_cost = (cost_yes + added_yes) / (qty_yes + buy_qty_yes) + avg_no
+        can_yes = new_pair_cost < max_cost and (
+            qty_no == 0 or pair_cost - new_pair_cost >= min_improve
+        )
+
+    # Côté NO
+    if total_cost + added_no > max_pos:
+        can_no = False
+    elif qty_no == 0:
+        can_no = price_no < first_threshold
+    else:
+        if qty_yes == 0:
+            new_pair_cost = 1.0
+        else:
+            new_pair_cost = avg_yes + (cost_no + added_no) / (qty_no + buy_qty_no)
+        can_no = new_pair_cost < max_cost and (
+            qty_yes == 0 or pair_cost - new_pair_cost >= min_improve
+        )
+
+    # Les deux sont possibles: choisir le moins cher
+    if can_yes and can_no:
+        return _ACTION_YES if price_yes <= price_no else _ACTION_NO
+    if can_yes:
+        return _ACTION_YES
+    if can_no:
+        return _ACTION_NO
+    return _ACTION_NONE
+
+
 class GabagoolStatus(Enum):
     STOPPED = "stopped"
     RUNNING = "running"
     PAUSED = "paused"
 
 
-@dataclass
+# Membre résolu une fois: is_running compare par identité, sans lookup sur la classe Enum
+_RUNNING = GabagoolStatus.RUNNING
+
+
+@dataclass(slots=True)
 class PairPosition:
     """
     Position sur un marché binaire (YES + NO).
@@ -36,6 +128,7 @@ class PairPosition:
     Optimisations HFT:
     - Cache des propriétés calculées pour éviter recalculs
     - Mise à jour du cache uniquement lors des trades
+    - __slots__: pas de __dict__ par position, accès attributs en C
     """
 
     market_id: str
@@ -57,13 +150,25 @@ class PairPosition:
 
     # Timing
     created_at: datetime = field(default_factory=datetime.now)
-    last_trade_at: Optional[datetime] = None
-
-    # Cache des propriétés calculées (HFT optimisation)
-    _cached_avg_yes: float = field(default=0.0, init=False, repr=False)
-    _cached_avg_no: float = field(default=0.0, init=False, repr=False)
-    _cached_pair_cost: float = field(default=1.0, init=False, repr=False)
-    _cached_is_locked: bool = field(default=False, init=False, repr=False)
+    last_trade_ns: int = 0  # time.monotonic_ns() du dernier trade (0 = aucun)
+
+    # Derniers prix analysés (seuil de changement), 0.0 = jamais analysé
+    last_price_yes: float = field(default=0.0, repr=False, compare=False)
+    last_price_no: float = field(default=0.0, repr=False, compare=False)
+
+    # Valeurs dérivées, recalculées à chaque trade (HFT optimisation).
+    # Attributs slots plutôt que @property: lecture directe, sans appel Python
+    avg_yes: float = field(default=0.0, init=False, repr=False, compare=False)    # Prix moyen YES
+    avg_no: float = field(default=0.0, init=False, repr=False, compare=False)     # Prix moyen NO
+    pair_cost: float = field(default=1.0, init=False, repr=False, compare=False)  # avg_yes + avg_no
+    total_cost: float = field(default=0.0, init=False, repr=False, compare=False) # cost_yes + cost_no
+    min_qty: float = field(default=0.0, init=False, repr=False, compare=False)    # Paiement garanti
+    locked_profit: float = field(default=0.0, init=False, repr=False, compare=False)  # min_qty - total_cost
+    is_locked: bool = field(default=False, init=False, repr=False, compare=False) # locked_profit > 0
+    is_balanced: bool = field(default=False, init=False, repr=False, compare=False)  # ratio YES/NO dans [0.8, 1.2]
+
+    # Dernier to_dict(), invalidé par _update_cache (None = à reconstruire)
+    _dict_cache: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Initialise le cache après création."""
@@ -71,87 +176,55 @@ class PairPosition:
 
     def _update_cache(self) -> None:
         """Met à jour toutes les valeurs cachées."""
+        self._dict_cache = None
         # avg_yes
-        self._cached_avg_yes = self.cost_yes / self.qty_yes if self.qty_yes > 0 else 0.0
+        self.avg_yes = self.cost_yes / self.qty_yes if self.qty_yes > 0 else 0.0
         # avg_no
-        self._cached_avg_no = self.cost_no / self.qty_no if self.qty_no > 0 else 0.0
+        self.avg_no = self.cost_no / self.qty_no if self.qty_no > 0 else 0.0
+        # is_balanced
+        if self.qty_yes == 0 or self.qty_no == 0:
+            self.is_balanced = False
+        else:
+            self.is_balanced = 0.8 <= self.qty_yes / self.qty_no <= 1.2
         # pair_cost
         if self.qty_yes > 0 and self.qty_no > 0:
-            self._cached_pair_cost = self._cached_avg_yes + self._cached_avg_no
+            self.pair_cost = self.avg_yes + self.avg_no
         else:
-            self._cached_pair_cost = 1.0
-        # is_locked
-        locked_profit = min(self.qty_yes, self.qty_no) - (self.cost_yes + self.cost_no)
-        self._cached_is_locked = locked_profit > 0
-
-    @property
-    def avg_yes(self) -> float:
-        """Prix moyen payé pour YES (cached)."""
-        return self._cached_avg_yes
-
-    @property
-    def avg_no(self) -> float:
-        """Prix moyen payé pour NO (cached)."""
-        return self._cached_avg_no
-
-    @property
-    def pair_cost(self) -> float:
-        """Coût de la paire (cached)."""
-        return self._cached_pair_cost
-
-    @property
-    def total_cost(self) -> float:
-        """Coût total investi."""
-        return self.cost_yes + self.cost_no
-
-    @property
-    def min_qty(self) -> float:
-        """Quantité minimum (détermine le paiement garanti)."""
-        return min(self.qty_yes, self.qty_no)
+            self.pair_cost = 1.0
+        # total_cost, min_qty, locked_profit et is_locked en une seule passe
+        total_cost = self.cost_yes + self.cost_no
+        min_qty = min(self.qty_yes, self.qty_no)
+        locked_profit = min_qty - total_cost
+        self.total_cost = total_cost
+        self.min_qty = min_qty
+        self.locked_profit = locked_profit
+        self.is_locked = locked_profit > 0
 
     @property
     def guaranteed_payout(self) -> float:
         """Paiement garanti au settlement."""
         return self.min_qty
 
-    @property
-    def locked_profit(self) -> float:
-        """Profit verrouillé (si > 0, on a gagné)."""
-        return self.guaranteed_payout - self.total_cost
-
-    @property
-    def is_locked(self) -> bool:
-        """True si le profit est verrouillé (cached)."""
-        return self._cached_is_locked
-
-    @property
-    def is_balanced(self) -> bool:
-        """True si les quantités sont équilibrées."""
-        if self.qty_yes == 0 or self.qty_no == 0:
-            return False
-        ratio = self.qty_yes / self.qty_no
-        return 0.8 <= ratio <= 1.2
-
     def simulate_buy_yes_fast(self, price: float, qty: float) -> float:
         """Simule un achat YES (version inline optimisée)."""
         new_avg_yes = (self.cost_yes + price * qty) / (self.qty_yes + qty)
         if self.qty_no == 0:
             return 1.0
-        return new_avg_yes + self._cached_avg_no
+        return new_avg_yes + self.avg_no
 
     def simulate_buy_no_fast(self, price: float, qty: float) -> float:
         """Simule un achat NO (version inline optimisée)."""
         new_avg_no = (self.cost_no + price * qty) / (self.qty_no + qty)
         if self.qty_yes == 0:
             return 1.0
-        return self._cached_avg_yes + new_avg_no
+        return self.avg_yes + new_avg_no
 
     def add_yes(self, price: float, qty: float) -> None:
         """Ajoute des shares YES et met à jour le cache."""
         self.qty_yes += qty
         self.cost_yes += price * qty
         self.trades_yes += 1
-        self.last_trade_at = datetime.now()
+        self.last_trade_ns = time.monotonic_ns()
         self._update_cache()
 
     def add_no(self, price: float, qty: float) -> None:
@@ -159,12 +232,19 @@ class PairPosition:
         self.qty_no += qty
         self.cost_no += price * qty
         self.trades_no += 1
-        self.last_trade_at = datetime.now()
+        self.last_trade_ns = time.monotonic_ns()
         self._update_cache()
 
     def to_dict(self) -> dict:
-        """Convertit en dictionnaire."""
-        return {
+        """
+        Convertit en dictionnaire (lectures de slots uniquement).
+
+        Le dict est mis en cache jusqu'au prochain trade: ne pas le modifier.
+        """
+        cached = self._dict_cache
+        if cached is not None:
+            return cached
+        cached = self._dict_cache = {
             "market_id": self.market_id,
             "question": self.question[:50] if self.question else "",
             "qty_yes": round(self.qty_yes, 2),
@@ -180,11 +260,17 @@ class PairPosition:
             "is_balanced": self.is_balanced,
             "trades": self.trades_yes + self.trades_no,
         }
+        return cached
 
 
-@dataclass
+@dataclass(slots=True)
 class GabagoolConfig:
-    """Configuration de la stratégie (modifiable par AutoOptimizer)."""
+    """
+    Configuration de la stratégie (modifiable par AutoOptimizer).
+
+    __slots__: lecture des seuils en C sur le chemin de décision; l'objet
+    reste mutable en place (AutoOptimizer, dashboard).
+    """
 
     max_pair_cost: float = 0.98       # Pair cost max acceptable (0.90-0.99)
     min_improvement: float = 0.005    # Amélioration min du pair_cost pour acheter (0.000-0.010)
@@ -222,13 +308,22 @@ class GabagoolEngine:
         self._active_ids: set = set()
         self._locked_ids: set = set()
 
-        # Cache des derniers prix (pour seuil de changement)
-        self._last_prices: Dict[str, tuple] = {}  # market_id -> (price_yes, price_no)
+        # Listes de positions matérialisées, invalidées quand les sets changent
+        self._active_cache: Optional[List[PairPosition]] = None
+        self._locked_cache: Optional[List[PairPosition]] = None
+        self._active_ids_view: Optional[frozenset] = None
+
+        # (total_locked_profit, total_potential_profit), invalidé à chaque trade
+        self._profit_totals: Optional[Tuple[float, float]] = None
 
         # Stats globales
         self._total_trades = 0
         self._total_invested = 0.0
-        self._start_time: Optional[datetime] = None
+        self._start_ns: Optional[int] = None  # time.monotonic_ns() au démarrage
+
+        # Buffer des logs de trades, vidé par _drain_logs pendant l'exécution
+        self._log_buf: deque[str] = deque(maxlen=LOG_BUFFER_SIZE)
+        self._log_task: Optional[asyncio.Task] = None
 
     @property
     def status(self) -> GabagoolStatus:
@@ -236,7 +331,7 @@ class GabagoolEngine:
 
     @property
     def is_running(self) -> bool:
-        return self._status == GabagoolStatus.RUNNING
+        return self._status is _RUNNING
 
     # ═══════════════════════════════════════════════════════════════
     # GESTION DES POSITIONS
@@ -259,20 +354,31 @@ class GabagoolEngine:
             )
             self._positions[market_id] = position
             self._active_ids.add(market_id)  # Nouvelle position = active
+            self._active_cache = None
+            self._active_ids_view = None
         return self._positions[market_id]
 
     def _update_position_sets(self, market_id: str) -> None:
         """Met à jour les sets active/locked pour une position."""
+        self._profit_totals = None  # locked_profit a pu changer
         position = self._positions.get(market_id)
         if not position:
             return
 
+        # Invalider les listes cachées seulement si l'appartenance change
         if position.is_locked:
-            self._locked_ids.add(market_id)
-            self._active_ids.discard(market_id)
-        else:
+            if market_id not in self._locked_ids:
+                self._locked_ids.add(market_id)
+                self._active_ids.discard(market_id)
+                self._active_cache = None
+                self._locked_cache = None
+                self._active_ids_view = None
+        elif market_id not in self._active_ids:
             self._active_ids.add(market_id)
             self._locked_ids.discard(market_id)
+            self._active_cache = None
+            self._locked_cache = None
+            self._active_ids_view = None
 
     def get_position(self, market_id: str) -> Optional[PairPosition]:
         """Récupère une position existante."""
@@ -283,16 +389,41 @@ class GabagoolEngine:
         return list(self._positions.values())
 
     def get_active_positions(self) -> List[PairPosition]:
-        """Retourne les positions non-verrouillées (O(k) via set)."""
-        return [self._positions[mid] for mid in self._active_ids if mid in self._positions]
+        """
+        Retourne les positions non-verrouillées.
+
+        Liste cachée (O(1) entre deux changements des sets), à ne pas modifier.
+        """
+        cache = self._active_cache
+        if cache is None:
+            # Chaque id des sets est dans _positions par construction
+            assert self._active_ids <= self._positions.keys()  # retiré sous python -O
+            cache = self._active_cache = list(map(self._positions.__getitem__, self._active_ids))
+        return cache
 
     def get_locked_positions(self) -> List[PairPosition]:
-        """Retourne les positions avec profit verrouillé (O(k) via set)."""
-        return [self._positions[mid] for mid in self._locked_ids if mid in self._positions]
+        """
+        Retourne les positions avec profit verrouillé.
+
+        Liste cachée (O(1) entre deux changements des sets), à ne pas modifier.
+        """
+        cache = self._locked_cache
+        if cache is None:
+            assert self._locked_ids <= self._positions.keys()  # retiré sous python -O
+            cache = self._locked_cache = list(map(self._positions.__getitem__, self._locked_ids))
+        return cache
 
-    def get_active_position_ids(self) -> set:
-        """Retourne les IDs des positions actives (pour priorité scanner)."""
-        return self._active_ids.copy()
+    def get_active_position_ids(self) -> frozenset:
+        """
+        Retourne les IDs des positions actives (pour priorité scanner).
+
+        Snapshot immuable, recréé seulement quand le set actif change
+        (au lieu d'une copie à chaque scan).
+        """
+        view = self._active_ids_view
+        if view is None:
+            view = self._active_ids_view = frozenset(self._active_ids)
+        return view
 
     # ═══════════════════════════════════════════════════════════════
     # LOGIQUE DE DÉCISION
@@ -319,13 +450,17 @@ class GabagoolEngine:
         position = self.get_or_create_position(market_id, token_yes_id, token_no_id, question)
 
         # Cache config values localement (micro-optimisation)
-        max_pos = self.config.max_position_usd
-        max_cost = self.config.max_pair_cost
-        min_improve = self.config.min_improvement
-        first_threshold = self.config.first_buy_threshold
+        config = self.config
+        max_pos = config.max_position_usd
+        max_cost = config.max_pair_cost
+        min_improve = config.min_improvement
+        first_threshold = config.first_buy_threshold
+
+        # Coût ajouté par l'achat (réutilisé pour la limite et le nouveau prix moyen)
+        added_cost = price * qty
 
         # Vérifier la limite de position
-        if position.total_cost + (price * qty) > max_pos:
+        if position.total_cost + added_cost > max_pos:
             return False
 
         # Premier achat YES - toujours OK si prix sous le seuil
@@ -333,11 +468,11 @@ class GabagoolEngine:
             return price < first_threshold
 
         # Calcul inline du nouveau pair_cost (évite appel fonction)
-        new_avg_yes = (position.cost_yes + price * qty) / (position.qty_yes + qty)
+        new_avg_yes = (position.cost_yes + added_cost) / (position.qty_yes + qty)
         if position.qty_no == 0:
             new_pair_cost = 1.0
         else:
-            new_pair_cost = new_avg_yes + position._cached_avg_no
+            new_pair_cost = new_avg_yes + position.avg_no
 
         # Vérifier conditions
         if new_pair_cost >= max_cost:
@@ -345,7 +480,7 @@ class GabagoolEngine:
 
         # L'achat doit améliorer le pair_cost
         if position.qty_no > 0:
-            improvement = position._cached_pair_cost - new_pair_cost
+            improvement = position.pair_cost - new_pair_cost
             if improvement < min_improve:
                 return False
 
@@ -372,13 +507,17 @@ class GabagoolEngine:
         position = self.get_or_create_position(market_id, token_yes_id, token_no_id, question)
 
         # Cache config values localement
-        max_pos = self.config.max_position_usd
-        max_cost = self.config.max_pair_cost
-        min_improve = self.config.min_improvement
-        first_threshold = self.config.first_buy_threshold
+        config = self.config
+        max_pos = config.max_position_usd
+        max_cost = config.max_pair_cost
+        min_improve = config.min_improvement
+        first_threshold = config.first_buy_threshold
+
+        # Coût ajouté par l'achat (réutilisé pour la limite et le nouveau prix moyen)
+        added_cost = price * qty
 
         # Vérifier la limite de position
-        if position.total_cost + (price * qty) > max_pos:
+        if position.total_cost + added_cost > max_pos:
             return False
 
         # Premier achat NO - toujours OK si prix sous le seuil
@@ -386,11 +525,11 @@ class GabagoolEngine:
             return price < first_threshold
 
         # Calcul inline du nouveau pair_cost
-        new_avg_no = (position.cost_no + price * qty) / (position.qty_no + qty)
+        new_avg_no = (position.cost_no + added_cost) / (position.qty_no + qty)
         if position.qty_yes == 0:
             new_pair_cost = 1.0
         else:
-            new_pair_cost = position._cached_avg_yes + new_avg_no
+            new_pair_cost = position.avg_yes + new_avg_no
 
         # Vérifier conditions
         if new_pair_cost >= max_cost:
@@ -398,7 +537,7 @@ class GabagoolEngine:
 
         # L'achat doit améliorer le pair_cost
         if position.qty_yes > 0:
-            improvement = position._cached_pair_cost - new_pair_cost
+            improvement = position.pair_cost - new_pair_cost
             if improvement < min_improve:
                 return False
 
@@ -441,20 +580,7 @@ class GabagoolEngine:
                 print(f"Erreur exécution YES: {e}")
                 return False
 
-        # Mettre à jour la position
-        position.add_yes(price, qty)
-        self._total_trades += 1
-        self._total_invested += price * qty
-
-        # Mettre à jour les sets active/locked
-        self._update_position_sets(market_id)
-
-        print(f"🟢 BUY YES: {qty:.0f} @ ${price:.3f} | Pair Cost: {position.pair_cost:.4f}")
-
-        # Vérifier si on a verrouillé le profit
-        if position.is_locked:
-            print(f"🎉 PROFIT VERROUILLÉ: ${position.locked_profit:.2f} sur {market_id[:16]}...")
-
+        self._record_buy(position, market_id, True, price, qty)
         return True
 
     async def buy_no(
@@ -490,21 +616,120 @@ class GabagoolEngine:
                 print(f"Erreur exécution NO: {e}")
                 return False
 
+        self._record_buy(position, market_id, False, price, qty)
+        return True
+
+    async def execute_batch(
+        self,
+        actions: List[Tuple[str, str, str, float, float, str]]
+    ) -> List[bool]:
+        """
+        Exécute un lot d'achats, ordres envoyés en parallèle.
+
+        Mêmes vérifications que buy_yes/buy_no, mais les allers-retours
+        réseau se chevauchent au lieu de s'enchaîner.
+
+        Args:
+            actions: Tuples (action, market_id, token_id, price, qty, question)
+                     avec action = "buy_yes" ou "buy_no"
+
+        Returns:
+            Liste de bool (ordre exécuté ou non), dans l'ordre des actions
+        """
+        executed = [False] * len(actions)
+        pending = []  # (index, position, market_id, is_yes, token_id, price, qty)
+
+        for i, (action, market_id, token_id, price, qty, question) in enumerate(actions):
+            if action == "buy_yes":
+                position = self.get_or_create_position(market_id, token_id, "", question)
+                if self.should_buy_yes(market_id, price, qty):
+                    pending.append((i, position, market_id, True, token_id, price, qty))
+            elif action == "buy_no":
+                position = self.get_or_create_position(market_id, "", token_id, question)
+                if self.should_buy_no(market_id, price, qty):
+                    pending.append((i, position, market_id, False, token_id, price, qty))
+
+        if not pending:
+            return executed
+
+        client = self.private_client
+        if client:
+            results = await asyncio.gather(
+                *(
+                    client.create_limit_order(
+                        token_id=token_id, side="BUY", price=price, size=qty
+                    )
+                    for _, _, _, _, token_id, price, qty in pending
+                ),
+                return_exceptions=True
+            )
+        else:
+            results = [None] * len(pending)
+
+        # Appliquer les ordres acceptés en une passe
+        for (i, position, market_id, is_yes, _, price, qty), result in zip(pending, results):
+            side = "YES" if is_yes else "NO"
+            if isinstance(result, BaseException):
+                print(f"Erreur exécution {side}: {result}")
+                continue
+            if result is not None and result.get("error"):
+                print(f"Erreur achat {side}: {result}")
+                continue
+            self._record_buy(position, market_id, is_yes, price, qty)
+            executed[i] = True
+
+        return executed
+
+    def _record_buy(
+        self,
+        position: PairPosition,
+        market_id: str,
+        is_yes: bool,
+        price: float,
+        qty: float
+    ) -> None:
+        """Applique un achat exécuté à la position et aux stats."""
         # Mettre à jour la position
-        position.add_no(price, qty)
+        if is_yes:
+            position.add_yes(price, qty)
+        else:
+            position.add_no(price, qty)
         self._total_trades += 1
         self._total_invested += price * qty
 
         # Mettre à jour les sets active/locked
         self._update_position_sets(market_id)
 
-        print(f"🔴 BUY NO: {qty:.0f} @ ${price:.3f} | Pair Cost: {position.pair_cost:.4f}")
+        log_buf = self._log_buf
+        if is_yes:
+            log_buf.append(f"🟢 BUY YES: {qty:.0f} @ ${price:.3f} | Pair Cost: {position.pair_cost:.4f}\n")
+        else:
+            log_buf.append(f"🔴 BUY NO: {qty:.0f} @ ${price:.3f} | Pair Cost: {position.pair_cost:.4f}\n")
 
         # Vérifier si on a verrouillé le profit
         if position.is_locked:
-            print(f"🎉 PROFIT VERROUILLÉ: ${position.locked_profit:.2f} sur {market_id[:16]}...")
-
-        return True
+            log_buf.append(f"🎉 PROFIT VERROUILLÉ: ${position.locked_profit:.2f} sur {market_id[:16]}...\n")
+
+        # Moteur non démarré: pas de tâche de vidage, écrire directement
+        if self._log_task is None:
+            self._flush_logs()
+
+    def _flush_logs(self) -> None:
+        """Écrit les logs en attente en un seul appel."""
+        log_buf = self._log_buf
+        if log_buf:
+            sys.stdout.write("".join(log_buf))
+            log_buf.clear()
+            sys.stdout.flush()
+
+    async def _drain_logs(self) -> None:
+        """Vide le buffer de logs toutes les LOG_FLUSH_INTERVAL secondes."""
+        try:
+            while True:
+                await asyncio.sleep(LOG_FLUSH_INTERVAL)
+                self._flush_logs()
+        finally:
+            self._flush_logs()
 
     # ═══════════════════════════════════════════════════════════════
     # ANALYSE DES OPPORTUNITÉS
@@ -533,36 +758,113 @@ class GabagoolEngine:
         if market_id in self._locked_ids:
             return None
 
-        # Seuil de changement de prix (0.5%) - skip si pas de mouvement
-        PRICE_THRESHOLD = 0.005
-        if market_id in self._last_prices:
-            old_yes, old_no = self._last_prices[market_id]
-            yes_change = abs(price_yes - old_yes) / old_yes if old_yes > 0 else 1.0
-            no_change = abs(price_no - old_no) / old_no if old_no > 0 else 1.0
-            if yes_change < PRICE_THRESHOLD and no_change < PRICE_THRESHOLD:
-                return None  # Prix stables, skip
+        position = self.get_or_create_position(market_id, token_yes_id, token_no_id, question)
+
+        # Seuil de changement de prix (0.5%) - skip si pas de mouvement.
+        # Un ancien prix nul (jamais analysé) compte comme un changement;
+        # le côté NO n'est évalué que si YES est stable.
+        old_yes = position.last_price_yes
+        old_no = position.last_price_no
+        if (
+            old_yes > 0
+            and abs(price_yes - old_yes) / old_yes < PRICE_CHANGE_THRESHOLD
+            and old_no > 0
+            and abs(price_no - old_no) / old_no < PRICE_CHANGE_THRESHOLD
+        ):
+            return None  # Prix stables, skip
+
+        # Mettre à jour les derniers prix (en place, sans allocation)
+        position.last_price_yes = price_yes
+        position.last_price_no = price_no
+
+        return self._choose_action(
+            market_id, token_yes_id, token_no_id, price_yes, price_no, question
+        )
+
+    async def analyze_opportunities(
+        self,
+        markets: Iterable[Tuple[str, str, str, float, float, str]]
+    ) -> List[Tuple[str, str]]:
+        """
+        Analyse un lot de marchés en une seule passe.
+
+        Même logique que analyze_opportunity, avec les lookups (sets,
+        seuil) liés une fois pour tout le lot.
+
+        Args:
+            markets: Tuples (market_id, token_yes_id, token_no_id,
+                     price_yes, price_no, question)
+
+        Returns:
+            Liste de (market_id, "buy_yes" | "buy_no") pour les marchés à trader
+        """
+        locked_ids = self._locked_ids
+        get_position = self.get_or_create_position
+        threshold = PRICE_CHANGE_THRESHOLD
+        choose_action = self._choose_action
+        actions = []
+
+        for market_id, token_yes_id, token_no_id, price_yes, price_no, question in markets:
+            if market_id in locked_ids:
+                continue
+
+            position = get_position(market_id, token_yes_id, token_no_id, question)
+            old_yes = position.last_price_yes
+            old_no = position.last_price_no
+            if (
+                old_yes > 0
+                and abs(price_yes - old_yes) / old_yes < threshold
+                and old_no > 0
+                and abs(price_no - old_no) / old_no < threshold
+            ):
+                continue
+            position.last_price_yes = price_yes
+            position.last_price_no = price_no
+
+            action = choose_action(
+                market_id, token_yes_id, token_no_id, price_yes, price_no, question
+            )
+            if action is not None:
+                actions.append((market_id, action))
+
+        return actions
+
+    def _choose_action(
+        self,
+        market_id: str,
+        token_yes_id: str,
+        token_no_id: str,
+        price_yes: float,
+        price_no: float,
+        question: str
+    ) -> Optional[str]:
+        """Évalue les deux côtés d'un marché dont le prix a bougé."""
+        # Le marché peut s'être verrouillé depuis le filtrage de l'appelant
+        if market_id in self._locked_ids:
+            return None
 
-        # Mettre à jour le cache des prix
-        self._last_prices[market_id] = (price_yes, price_no)
+        position = self.get_or_create_position(market_id, token_yes_id, token_no_id, question)
+        config = self.config
 
         # Calculer les quantités
-        order_size = self.config.order_size_usd
+        order_size = config.order_size_usd
         qty_yes = order_size / price_yes if price_yes > 0 else 0
         qty_no = order_size / price_no if price_no > 0 else 0
 
-        # Évaluation parallèle: vérifier les deux côtés
-        can_buy_yes = self.should_buy_yes(market_id, price_yes, qty_yes, token_yes_id, token_no_id, question)
-        can_buy_no = self.should_buy_no(market_id, price_no, qty_no, token_yes_id, token_no_id, question)
-
-        # Choisir la meilleure opportunité
-        if can_buy_yes and can_buy_no:
-            # Les deux sont possibles: choisir le moins cher
-            return "buy_yes" if price_yes <= price_no else "buy_no"
-        elif can_buy_yes:
+        # Évaluation des deux côtés en un seul appel
+        action = _decide(
+            position.qty_yes, position.qty_no,
+            position.cost_yes, position.cost_no,
+            position.avg_yes, position.avg_no,
+            position.pair_cost,
+            price_yes, price_no, qty_yes, qty_no,
+            config.max_position_usd, config.max_pair_cost,
+            config.min_improvement, config.first_buy_threshold,
+        )
+        if action == _ACTION_YES:
             return "buy_yes"
-        elif can_buy_no:
+        if action == _ACTION_NO:
             return "buy_no"
-
         return None
 
     # ═══════════════════════════════════════════════════════════════
@@ -571,11 +873,13 @@ class GabagoolEngine:
 
     async def start(self) -> None:
         """Démarre la stratégie."""
-        if self._status == GabagoolStatus.RUNNING:
+        if self._status is _RUNNING:
             return
 
         self._status = GabagoolStatus.RUNNING
-        self._start_time = datetime.now()
+        self._start_ns = time.monotonic_ns()
+        if self._log_task is None:
+            self._log_task = asyncio.create_task(self._drain_logs())
         print("🦀 Gabagool Engine démarré")
 
     async def stop(self) -> None:
@@ -589,6 +893,15 @@ class GabagoolEngine:
             except asyncio.CancelledError:
                 pass
 
+        # Vider les derniers logs de trades
+        if self._log_task:
+            self._log_task.cancel()
+            try:
+                await self._log_task
+            except asyncio.CancelledError:
+                pass
+            self._log_task = None
+
         print("🦀 Gabagool Engine arrêté")
 
     async def pause(self) -> None:
@@ -608,26 +921,31 @@ class GabagoolEngine:
 
     def get_stats(self) -> dict:
         """Retourne les statistiques globales."""
-        positions = self.get_all_positions()
-        locked = self.get_locked_positions()
-
-        total_locked_profit = sum(p.locked_profit for p in locked)
-        total_potential_profit = sum(
-            p.locked_profit for p in positions if p.locked_profit > 0
-        )
+        positions_count = len(self._positions)
+        locked_count = len(self._locked_ids)
+
+        # Totaux recalculés seulement après un trade (polling dashboard)
+        totals = self._profit_totals
+        if totals is None:
+            total_locked_profit = sum(p.locked_profit for p in self.get_locked_positions())
+            total_potential_profit = sum(
+                p.locked_profit for p in self._positions.values() if p.locked_profit > 0
+            )
+            totals = self._profit_totals = (total_locked_profit, total_potential_profit)
+        total_locked_profit, total_potential_profit = totals
 
         uptime = 0
-        if self._start_time:
-            uptime = (datetime.now() - self._start_time).total_seconds()
+        if self._start_ns is not None:
+            uptime = (time.monotonic_ns() - self._start_ns) * 1e-9
 
         return {
             "status": self._status.value,
             "uptime_seconds": int(uptime),
             "total_trades": self._total_trades,
             "total_invested": round(self._total_invested, 2),
-            "positions_count": len(positions),
-            "locked_count": len(locked),
-            "active_count": len(positions) - len(locked),
+            "positions_count": positions_count,
+            "locked_count": locked_count,
+            "active_count": positions_count - locked_count,
             "total_locked_profit": round(total_locked_profit, 2),
             "total_potential_profit": round(total_potential_profit, 2),
             "config": {
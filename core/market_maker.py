@@ -17,13 +17,24 @@ Documentation: https://docs.polymarket.com
 """
 
 from typing import Optional, Dict, List, Tuple
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from enum import Enum
 import asyncio
+import heapq
+import time
 
 from api.private import PolymarketPrivate
 from core.scanner import MarketData
+from core.performance import get_async_logger
+
+
+log = get_async_logger("mm")
+
+# Grille de prix Polymarket: calculs de cotation en ticks entiers de 1/TICK $
+TICK = 1000
+MIN_PRICE_TICKS = 10    # 0.01 $
+MAX_PRICE_TICKS = 990   # 0.99 $
 
 
 class MMStatus(Enum):
@@ -41,7 +52,7 @@ class MMSide(Enum):
     BOTH = "both"
 
 
-@dataclass
+@dataclass(slots=True)
 class MMOrder:
     """Représente un ordre de market making."""
     order_id: str
@@ -51,7 +62,8 @@ class MMOrder:
     size: float
     filled: float = 0.0
     status: str = "pending"
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=datetime.now)  # Affichage uniquement
+    created_monotonic: float = field(default_factory=time.monotonic)  # Calcul de l'âge
 
     @property
     def is_filled(self) -> bool:
@@ -62,7 +74,7 @@ class MMOrder:
         return self.size - self.filled
 
 
-@dataclass
+@dataclass(slots=True)
 class MMPosition:
     """Position actuelle sur un marché."""
     market_id: str
@@ -83,17 +95,21 @@ class MMPosition:
         """Vérifie si la position est équilibrée."""
         return abs(self.net_position) < 10  # Tolérance de 10 shares
 
-    @property
     def unrealized_pnl(self, yes_price: float = 0.5, no_price: float = 0.5) -> float:
-        """P&L non réalisé."""
+        """P&L non réalisé aux prix donnés (méthode: une property ne prend pas d'arguments)."""
         yes_value = self.yes_shares * yes_price
         no_value = self.no_shares * no_price
         return yes_value + no_value - self.total_cost
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MMConfig:
-    """Configuration du market maker."""
+    """
+    Configuration du market maker.
+
+    Immuable: pour modifier, remplacer l'instance (dataclasses.replace),
+    ce qui recalcule les valeurs dérivées.
+    """
     # Spread cible
     target_spread: float = 0.04          # 4 cents de spread cible
     min_spread: float = 0.02             # Spread minimum acceptable
@@ -105,16 +121,38 @@ class MMConfig:
 
     # Décalage des prix
     price_offset: float = 0.01           # Décalage par rapport au mid
+    quote_tick: float = 0.001            # Mouvement min du carnet pour recoter un marché
     aggressive_offset: float = 0.005     # Décalage plus agressif si inventaire déséquilibré
 
     # Timing
     refresh_interval: float = 2.0        # Intervalle de rafraîchissement (secondes)
     order_timeout: int = 60              # Timeout des ordres (secondes)
+    stale_sweep_interval: float = 0.1    # Intervalle de la recherche d'ordres expirés (secondes)
+    max_concurrent_batches: int = 10     # Batches d'ordres soumis en parallèle (limite de débit API)
+    max_batch_orders: int = 15           # Ordres max par requête batch du CLOB
 
     # Gestion du risque
     max_inventory_imbalance: float = 200.0  # Déséquilibre max avant rééquilibrage
     stop_loss_pct: float = 0.10          # Stop loss à 10%
 
+    # Valeurs dérivées (calculées une fois dans __post_init__)
+    max_imbalance_half: float = field(init=False, repr=False)  # Seuil de rééquilibrage
+    rebalance_offset: float = field(init=False, repr=False)    # Offset du côté en excès
+    price_offset_ticks: int = field(init=False, repr=False)        # Offsets en ticks de prix
+    aggressive_offset_ticks: int = field(init=False, repr=False)
+    rebalance_offset_ticks: int = field(init=False, repr=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "max_imbalance_half", self.max_inventory_imbalance / 2)
+        object.__setattr__(self, "rebalance_offset", self.price_offset * 1.5)
+        object.__setattr__(self, "price_offset_ticks", round(self.price_offset * TICK))
+        object.__setattr__(self, "aggressive_offset_ticks", round(self.aggressive_offset * TICK))
+        object.__setattr__(self, "rebalance_offset_ticks", round(self.rebalance_offset * TICK))
+
+    def to_dict(self) -> dict:
+        """Convertit en dictionnaire (paramètres uniquement, sans valeurs dérivées)."""
+        return {f.name: getattr(self, f.name) for f in fields(self) if f.init}
+
 
 class MarketMaker:
     """
@@ -139,18 +177,27 @@ class MarketMaker:
         self.private_client = private_client
         self.config = config or MMConfig()
         self._status = MMStatus.STOPPED
-        self._task: Optional[asyncio.Task] = None
+        self._tasks: List[asyncio.Task] = []  # Boucle de cotation + balayage des ordres expirés
 
         # État interne
         self._positions: Dict[str, MMPosition] = {}
         self._active_orders: Dict[str, MMOrder] = {}
+        # Tas (created_monotonic, order_id): le plus vieil ordre en tête.
+        # Suppression paresseuse: les ids absents de _active_orders sont ignorés
+        self._order_heap: List[Tuple[float, str]] = []
+        self._active_by_token: Dict[str, str] = {}  # token_id -> order_id en place
         self._markets: Dict[str, MarketData] = {}
+        # Dernier carnet coté par marché: (bid_yes, ask_yes, bid_no, ask_no, time.monotonic())
+        self._last_quotes: Dict[str, Tuple[float, float, float, float, float]] = {}
+        # Carnets retenus au cycle en cours, en attente d'un ordre accepté
+        self._pending_quotes: Dict[str, Tuple[float, float, float, float, float]] = {}
+        self._batch_slots: Optional[asyncio.Semaphore] = None
 
         # Métriques
         self._total_trades = 0
         self._total_volume = 0.0
         self._total_pnl = 0.0
-        self._start_time: Optional[datetime] = None
+        self._start_monotonic: Optional[float] = None  # time.monotonic() au démarrage
 
     @property
     def status(self) -> MMStatus:
@@ -164,8 +211,8 @@ class MarketMaker:
     def stats(self) -> dict:
         """Statistiques du market maker."""
         uptime = 0
-        if self._start_time:
-            uptime = (datetime.now() - self._start_time).total_seconds()
+        if self._start_monotonic is not None:
+            uptime = time.monotonic() - self._start_monotonic
 
         return {
             "status": self._status.value,
@@ -183,10 +230,20 @@ class MarketMaker:
             return
 
         self._markets = markets
+        self._batch_slots = asyncio.Semaphore(self.config.max_concurrent_batches)
         self._status = MMStatus.RUNNING
-        self._start_time = datetime.now()
-        self._task = asyncio.create_task(self._run_loop())
-        print(f"🏪 Market Maker démarré sur {len(markets)} marchés")
+        self._start_monotonic = time.monotonic()
+
+        # Connexion HTTPS/TLS ouverte avant le premier batch d'ordres
+        if self.private_client:
+            await self.private_client.prime_connection()
+
+        # Cadences indépendantes: l'annulation n'attend plus le cycle de cotation
+        self._tasks = [
+            asyncio.create_task(self._run_loop()),
+            asyncio.create_task(self._cancel_sweep_loop()),
+        ]
+        log.info("🏪 Market Maker démarré sur %d marchés", len(markets))
 
     async def stop(self) -> None:
         """Arrête le market maker et annule tous les ordres."""
@@ -195,62 +252,155 @@ class MarketMaker:
         # Annuler tous les ordres actifs
         await self._cancel_all_orders()
 
-        if self._task:
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
 
-        print("🏪 Market Maker arrêté")
+        log.info("🏪 Market Maker arrêté")
 
     async def pause(self) -> None:
         """Met en pause le market maker (garde les ordres)."""
         self._status = MMStatus.PAUSED
-        print("🏪 Market Maker en pause")
+        log.info("🏪 Market Maker en pause")
 
     async def resume(self) -> None:
         """Reprend le market maker."""
         if self._status == MMStatus.PAUSED:
             self._status = MMStatus.RUNNING
-            print("🏪 Market Maker repris")
+            log.info("🏪 Market Maker repris")
 
     def update_markets(self, markets: Dict[str, MarketData]) -> None:
         """Met à jour les données de marché."""
         self._markets = markets
 
     async def _run_loop(self) -> None:
-        """Boucle principale du market maker."""
+        """Boucle de cotation du market maker (refresh_interval)."""
         while self._status == MMStatus.RUNNING:
             try:
-                for market_id, market_data in self._markets.items():
-                    if not market_data.is_valid:
-                        continue
-
-                    await self._process_market(market_id, market_data)
+                # Filtrage en une passe, puis les ordres de tous les marchés
+                # retenus sont soumis ensemble par batches de max_batch_orders
+                legs = []
+                for market_id, market_data, mid_yes, mid_no in self._select_markets():
+                    legs.extend(self._plan_market(market_id, market_data, mid_yes, mid_no))
+
+                batch_size = self.config.max_batch_orders
+                await asyncio.gather(*(
+                    self._submit_legs_guarded(legs[i:i + batch_size])
+                    for i in range(0, len(legs), batch_size)
+                ))
 
                 await asyncio.sleep(self.config.refresh_interval)
 
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                print(f"⚠️ Erreur Market Maker: {e}")
+                log.warning("⚠️ Erreur Market Maker: %s", e)
                 await asyncio.sleep(5)
 
-    async def _process_market(self, market_id: str, market_data: MarketData) -> None:
-        """Traite un marché: calcule les prix et place les ordres."""
-        # Calculer le mid-price
-        mid_yes = self._calculate_mid_price(market_data, "yes")
-        mid_no = self._calculate_mid_price(market_data, "no")
+    async def _cancel_sweep_loop(self) -> None:
+        """Annule les ordres expirés toutes les stale_sweep_interval secondes."""
+        while self._status == MMStatus.RUNNING:
+            try:
+                # Horloge lue une fois par balayage
+                await self._cancel_stale_orders(time.monotonic())
+                await asyncio.sleep(self.config.stale_sweep_interval)
 
-        if mid_yes is None or mid_no is None:
-            return
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                log.warning("⚠️ Erreur annulation ordres expirés: %s", e)
+                await asyncio.sleep(5)
+
+    def _select_markets(self) -> List[Tuple[str, MarketData, float, float]]:
+        """
+        Sélectionne les marchés à coter en une seule passe.
+
+        Filtres: données valides, mid-prices disponibles, spread >= min_spread,
+        carnet qui a bougé. Les marchés écartés ne coûtent ni coroutine
+        ni place dans un batch.
+
+        Returns:
+            Liste de (market_id, market_data, mid_yes, mid_no)
+        """
+        min_spread = self.config.min_spread
+        now = time.monotonic()
+        quotes_moved = self._quotes_moved
+        # Carnets à mémoriser si au moins un ordre du marché est accepté
+        pending_quotes = self._pending_quotes = {}
+        selected = []
+
+        for market_id, market_data in list(self._markets.items()):
+            if not market_data.is_valid:
+                continue
+
+            bid_yes = market_data.best_bid_yes
+            ask_yes = market_data.best_ask_yes
+            bid_no = market_data.best_bid_no
+            ask_no = market_data.best_ask_no
+            if bid_yes is None or ask_yes is None or bid_no is None or ask_no is None:
+                continue
+
+            if market_data.effective_spread < min_spread:
+                continue  # Spread trop serré, pas rentable
 
-        # Vérifier le spread
-        spread = self._calculate_spread(market_data)
-        if spread < self.config.min_spread:
-            return  # Spread trop serré, pas rentable
+            if not quotes_moved(market_id, bid_yes, ask_yes, bid_no, ask_no, now):
+                continue  # Carnet inchangé, ordres déjà en place
+
+            pending_quotes[market_id] = (bid_yes, ask_yes, bid_no, ask_no, now)
+
+            selected.append((market_id, market_data, (bid_yes + ask_yes) / 2, (bid_no + ask_no) / 2))
+
+        return selected
+
+    def _quotes_moved(
+        self,
+        market_id: str,
+        bid_yes: float,
+        ask_yes: float,
+        bid_no: float,
+        ask_no: float,
+        now: float
+    ) -> bool:
+        """
+        True si le marché doit être recoté.
+
+        Recote si un des 4 prix a bougé d'au moins quote_tick, ou si la
+        dernière cotation a plus de order_timeout secondes. Le carnet n'est
+        mémorisé (_last_quotes) qu'une fois un ordre accepté, dans
+        _submit_legs: un batch en échec est retenté au cycle suivant.
+        """
+        last = self._last_quotes.get(market_id)
+        if last is not None:
+            config = self.config
+            tick = config.quote_tick
+            if (
+                now - last[4] < config.order_timeout
+                and abs(bid_yes - last[0]) < tick
+                and abs(ask_yes - last[1]) < tick
+                and abs(bid_no - last[2]) < tick
+                and abs(ask_no - last[3]) < tick
+            ):
+                return False
+
+        return True
+
+    async def _submit_legs_guarded(self, legs: List[Tuple[str, str, str, float, float]]) -> None:
+        """Soumet un batch sous le sémaphore; une erreur n'annule pas les autres."""
+        async with self._batch_slots:
+            try:
+                await self._submit_legs(legs)
+            except Exception as e:
+                log.warning("⚠️ Erreur ordres MM: %s", e)
 
+    def _plan_market(
+        self,
+        market_id: str,
+        market_data: MarketData,
+        mid_yes: float,
+        mid_no: float
+    ) -> List[Tuple[str, str, str, float, float]]:
+        """Calcule les ordres voulus pour un marché retenu (sans I/O)."""
         # Obtenir ou créer la position
         position = self._get_or_create_position(market_id)
 
@@ -259,37 +409,19 @@ class MarketMaker:
             mid_yes, mid_no, position
         )
 
-        # Placer les ordres
-        await self._place_orders(
+        return self._plan_orders(
             market_data=market_data,
             buy_yes_price=buy_yes_price,
             buy_no_price=buy_no_price,
             position=position
         )
 
-    def _calculate_mid_price(self, market_data: MarketData, side: str) -> Optional[float]:
-        """Calcule le mid-price pour un côté."""
-        if side == "yes":
-            bid = market_data.best_bid_yes
-            ask = market_data.best_ask_yes
-        else:
-            bid = market_data.best_bid_no
-            ask = market_data.best_ask_no
-
-        if bid is None or ask is None:
-            return None
-
-        return (bid + ask) / 2
-
-    def _calculate_spread(self, market_data: MarketData) -> float:
-        """Calcule le spread effectif."""
-        return market_data.effective_spread
-
     def _get_or_create_position(self, market_id: str) -> MMPosition:
         """Obtient ou crée une position pour un marché."""
-        if market_id not in self._positions:
-            self._positions[market_id] = MMPosition(market_id=market_id)
-        return self._positions[market_id]
+        position = self._positions.get(market_id)  # Un seul lookup si existante
+        if position is None:
+            position = self._positions[market_id] = MMPosition(market_id=market_id)
+        return position
 
     def _calculate_order_prices(
         self,
@@ -301,123 +433,187 @@ class MarketMaker:
         Calcule les prix d'ordres en fonction de l'inventaire.
 
         Si on est long YES, on offre un meilleur prix sur NO pour rééquilibrer.
+
+        Calcul en ticks entiers (1/TICK $): les prix retournés tombent
+        exactement sur la grille, sans dérive flottante aux bornes.
         """
-        offset = self.config.price_offset
+        config = self.config
+        offset = config.price_offset_ticks
+        net_position = position.net_position
 
         # Ajuster l'offset selon le déséquilibre d'inventaire
-        if abs(position.net_position) > self.config.max_inventory_imbalance / 2:
-            if position.net_position > 0:  # Long YES, plus agressif sur NO
-                offset_no = self.config.aggressive_offset
-                offset_yes = self.config.price_offset * 1.5
+        if abs(net_position) > config.max_imbalance_half:
+            if net_position > 0:  # Long YES, plus agressif sur NO
+                offset_no = config.aggressive_offset_ticks
+                offset_yes = config.rebalance_offset_ticks
             else:  # Long NO, plus agressif sur YES
-                offset_yes = self.config.aggressive_offset
-                offset_no = self.config.price_offset * 1.5
+                offset_yes = config.aggressive_offset_ticks
+                offset_no = config.rebalance_offset_ticks
         else:
             offset_yes = offset
             offset_no = offset
 
         # Prix d'achat = mid - offset
-        buy_yes_price = mid_yes - offset_yes
-        buy_no_price = mid_no - offset_no
-
-        # S'assurer que les prix sont valides
-        buy_yes_price = max(0.01, min(0.99, buy_yes_price))
-        buy_no_price = max(0.01, min(0.99, buy_no_price))
-
-        return buy_yes_price, buy_no_price
-
-    async def _place_orders(
+        buy_yes_ticks = round(mid_yes * TICK) - offset_yes
+        buy_no_ticks = round(mid_no * TICK) - offset_no
+
+        # S'assurer que les prix sont valides (bornes [0.01, 0.99], sans appel min/max)
+        if buy_yes_ticks < MIN_PRICE_TICKS:
+            buy_yes_ticks = MIN_PRICE_TICKS
+        elif buy_yes_ticks > MAX_PRICE_TICKS:
+            buy_yes_ticks = MAX_PRICE_TICKS
+        if buy_no_ticks < MIN_PRICE_TICKS:
+            buy_no_ticks = MIN_PRICE_TICKS
+        elif buy_no_ticks > MAX_PRICE_TICKS:
+            buy_no_ticks = MAX_PRICE_TICKS
+
+        # Retour en dollars uniquement à la frontière API
+        return buy_yes_ticks / TICK, buy_no_ticks / TICK
+
+    def _plan_orders(
         self,
         market_data: MarketData,
         buy_yes_price: float,
         buy_no_price: float,
         position: MMPosition
-    ) -> None:
-        """Place les ordres de market making."""
-        if not self.private_client:
-            return
-
+    ) -> List[Tuple[str, str, str, float, float]]:
+        """
+        Construit les legs (market_id, label, token_id, price, size) à
+        soumettre, après application des limites de position.
+        """
         market = market_data.market
 
+        config = self.config
+
         # Vérifier les limites de position
-        if position.yes_shares >= self.config.max_position:
+        if position.yes_shares >= config.max_position:
             buy_yes_price = 0  # Ne pas acheter plus de YES
 
-        if position.no_shares >= self.config.max_position:
+        if position.no_shares >= config.max_position:
             buy_no_price = 0  # Ne pas acheter plus de NO
 
         # Calculer la taille en shares
-        size_yes = self.config.order_size / buy_yes_price if buy_yes_price > 0 else 0
-        size_no = self.config.order_size / buy_no_price if buy_no_price > 0 else 0
+        size_yes = config.order_size / buy_yes_price if buy_yes_price > 0 else 0
+        size_no = config.order_size / buy_no_price if buy_no_price > 0 else 0
 
-        # Placer l'ordre YES
+        legs = []
         if size_yes > 0:
-            try:
-                result = await self.private_client.create_limit_order(
-                    token_id=market.token_yes_id,
-                    side="BUY",
-                    price=buy_yes_price,
-                    size=size_yes
-                )
-                if result.get("orderID"):
-                    self._active_orders[result["orderID"]] = MMOrder(
-                        order_id=result["orderID"],
-                        token_id=market.token_yes_id,
-                        side="BUY",
-                        price=buy_yes_price,
-                        size=size_yes
-                    )
-                    print(f"📗 MM Order YES: BUY {size_yes:.0f} @ ${buy_yes_price:.3f}")
-            except Exception as e:
-                print(f"⚠️ Erreur ordre YES: {e}")
-
-        # Placer l'ordre NO
+            legs.append((position.market_id, "YES", market.token_yes_id, buy_yes_price, size_yes))
         if size_no > 0:
-            try:
-                result = await self.private_client.create_limit_order(
-                    token_id=market.token_no_id,
-                    side="BUY",
-                    price=buy_no_price,
-                    size=size_no
-                )
-                if result.get("orderID"):
-                    self._active_orders[result["orderID"]] = MMOrder(
-                        order_id=result["orderID"],
-                        token_id=market.token_no_id,
-                        side="BUY",
-                        price=buy_no_price,
-                        size=size_no
-                    )
-                    print(f"📕 MM Order NO: BUY {size_no:.0f} @ ${buy_no_price:.3f}")
-            except Exception as e:
-                print(f"⚠️ Erreur ordre NO: {e}")
+            legs.append((position.market_id, "NO", market.token_no_id, buy_no_price, size_no))
+        return legs
+
+    async def _submit_legs(self, legs: List[Tuple[str, str, str, float, float]]) -> None:
+        """
+        Soumet des legs en une seule requête batch, réponses par index.
+
+        Les legs peuvent venir de plusieurs marchés (un batch par cycle).
+        """
+        if not self.private_client or not legs:
+            return
+
+        # Ordres déjà en place sur ces tokens: remplacés plutôt qu'empilés
+        active_by_token = self._active_by_token
+        replaced = [
+            active_by_token[token_id]
+            for _, _, token_id, _, _ in legs
+            if token_id in active_by_token
+        ]
+        orders = [
+            {"token_id": token_id, "side": "BUY", "price": price, "size": size}
+            for _, _, token_id, price, size in legs
+        ]
+
+        try:
+            if replaced:
+                results = await self.private_client.amend_orders(replaced, orders)
+            else:
+                results = await self.private_client.place_orders_batch(orders)
+        except Exception as e:
+            log.warning("⚠️ Erreur ordres MM: %s", e)
+            return
+
+        if replaced and not all(
+            isinstance(r, dict) and r.get("error") == "cancel failed" for r in results
+        ):
+            # Annulation passée: les anciens ordres ne sont plus actifs
+            for order_id in replaced:
+                self._forget_order(order_id)
+
+        for (market_id, label, token_id, price, size), result in zip(legs, results):
+            order_id = result.get("orderID") if isinstance(result, dict) else None
+            if not order_id:
+                if isinstance(result, dict) and result.get("error"):
+                    log.warning("⚠️ Erreur ordre %s: %s", label, result["error"])
+                continue
+            order = MMOrder(
+                order_id=order_id,
+                token_id=token_id,
+                side="BUY",
+                price=price,
+                size=size
+            )
+            self._active_orders[order_id] = order
+            active_by_token[token_id] = order_id
+            # Marché effectivement coté: carnet mémorisé pour _quotes_moved
+            book = self._pending_quotes.pop(market_id, None)
+            if book is not None:
+                self._last_quotes[market_id] = book
+            heapq.heappush(self._order_heap, (order.created_monotonic, order_id))
+            icon = "📗" if label == "YES" else "📕"
+            log.info("%s MM Order %s: BUY %.0f @ $%.3f", icon, label, size, price)
 
     async def _cancel_all_orders(self) -> None:
         """Annule tous les ordres actifs."""
+        self._last_quotes.clear()  # Plus d'ordres en place: tout recoter au prochain cycle
+
         if not self.private_client:
             return
 
         try:
             await self.private_client.cancel_all_orders()
             self._active_orders.clear()
-            print("🗑️ Tous les ordres MM annulés")
+            self._order_heap.clear()
+            self._active_by_token.clear()
+            log.info("🗑️ Tous les ordres MM annulés")
         except Exception as e:
-            print(f"⚠️ Erreur annulation ordres: {e}")
+            log.warning("⚠️ Erreur annulation ordres: %s", e)
 
-    async def _cancel_stale_orders(self) -> None:
-        """Annule les ordres trop vieux."""
-        now = datetime.now()
+    async def _cancel_stale_orders(self, now: float) -> None:
+        """
+        Annule les ordres trop vieux (now = time.monotonic() du cycle).
+
+        Seule la tête expirée du tas est dépilée: O(k log N) pour k ordres
+        expirés, au lieu d'un parcours de tous les ordres actifs.
+        """
+        heap = self._order_heap
+        active_orders = self._active_orders
+        timeout = self.config.order_timeout
         stale_orders = []
 
-        for order_id, order in self._active_orders.items():
-            age = (now - order.created_at).total_seconds()
-            if age > self.config.order_timeout:
-                stale_orders.append(order_id)
+        while heap and now - heap[0][0] > timeout:
+            entry = heapq.heappop(heap)
+            if entry[1] in active_orders:  # Sinon déjà retiré
+                stale_orders.append(entry)
+
+        if not stale_orders:
+            return
 
-        for order_id in stale_orders:
-            if self.private_client:
-                await self.private_client.cancel_order(order_id)
-            del self._active_orders[order_id]
+        # Une seule requête d'annulation pour tout le lot
+        if self.private_client:
+            if not await self.private_client.cancel_orders([oid for _, oid in stale_orders]):
+                # Échec: les ordres restent actifs côté exchange, retentés au prochain cycle
+                for entry in stale_orders:
+                    heapq.heappush(heap, entry)
+                return
+        for _, order_id in stale_orders:
+            self._forget_order(order_id)
+
+    def _forget_order(self, order_id: str) -> None:
+        """Retire un ordre des ordres actifs et de l'index par token."""
+        order = self._active_orders.pop(order_id, None)
+        if order is not None and self._active_by_token.get(order.token_id) == order_id:
+            del self._active_by_token[order.token_id]
 
     def get_position(self, market_id: str) -> Optional[MMPosition]:
         """Récupère la position pour un marché."""
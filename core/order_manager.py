@@ -8,14 +8,23 @@ Fonctionnalités:
 4. Fermeture automatique sur conditions
 """
 
-import json
 import asyncio
-from typing import Optional
+from itertools import islice
+from collections import defaultdict, deque
+from typing import Iterable, Optional
 from dataclasses import dataclass, field, asdict
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
 from enum import Enum
 
+from core.performance import get_async_logger, json_dumps_bytes, json_loads
+
+
+log = get_async_logger("orders")
+
+# Trades gardés en mémoire (le journal JSONL conserve tout l'historique)
+HISTORY_MAX_TRADES = 10_000
+
 
 class OrderStatus(Enum):
     """Statuts d'un ordre."""
@@ -27,7 +36,7 @@ class OrderStatus(Enum):
     EXPIRED = "expired"
 
 
-@dataclass
+@dataclass(slots=True)
 class ActiveOrder:
     """Ordre actif."""
     id: str
@@ -66,7 +75,7 @@ class ActiveOrder:
         return data
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """Position ouverte sur un marché."""
     market_id: str
@@ -114,7 +123,7 @@ class Position:
         return (self.unrealized_pnl / self.total_invested) * 100
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeHistory:
     """Historique d'un trade complété."""
     id: str
@@ -142,6 +151,10 @@ class TradeHistory:
             "id": self.id,
             "market_id": self.market_id,
             "question": self.question,
+            "order_yes_id": self.order_yes_id,
+            "order_no_id": self.order_no_id,
+            "entry_value": self.entry_value,
+            "exit_value": self.exit_value,
             "pnl": self.pnl,
             "pnl_percentage": self.pnl_percentage,
             "duration_seconds": self.duration_seconds,
@@ -149,6 +162,24 @@ class TradeHistory:
             "closed_at": self.closed_at.isoformat(),
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "TradeHistory":
+        """Crée une instance depuis un dictionnaire (ligne du journal)."""
+        return cls(
+            id=data["id"],
+            market_id=data["market_id"],
+            question=data.get("question", ""),
+            order_yes_id=data.get("order_yes_id", ""),
+            order_no_id=data.get("order_no_id", ""),
+            entry_value=data.get("entry_value", 0.0),
+            exit_value=data.get("exit_value", 0.0),
+            pnl=data["pnl"],
+            pnl_percentage=data.get("pnl_percentage", 0.0),
+            opened_at=datetime.fromisoformat(data["opened_at"]),
+            closed_at=datetime.fromisoformat(data["closed_at"]),
+            duration_seconds=data.get("duration_seconds", 0),
+        )
+
 
 class OrderManager:
     """
@@ -162,22 +193,33 @@ class OrderManager:
     
     def __init__(self, trades_file: str = "data/trades.json"):
         self._orders: dict[str, ActiveOrder] = {}
+        # Sous-ensemble des ordres au statut "open", tenu à jour par
+        # add_order(s) / update_order_status / remove_order / clear
+        self._open_orders: dict[str, ActiveOrder] = {}
         self._positions: dict[str, Position] = {}
-        self._history: list[TradeHistory] = []
-        self._trades_file = Path(trades_file)
+        self._history: deque[TradeHistory] = deque(maxlen=HISTORY_MAX_TRADES)  # Anneau borné
+        self._trades_file = Path(trades_file)  # Compteurs (petit JSON réécrit)
+        self._trades_log = self._trades_file.with_suffix(".jsonl")  # Une ligne par trade (ajout seul)
         
         # Stats
         self._total_pnl = 0.0
         self._total_trades = 0
         self._winning_trades = 0
+        self._daily_pnl: defaultdict[date, float] = defaultdict(float)  # PnL cumulé par jour de clôture
+        
+        # Écriture disque en arrière-plan (une seule tâche, écritures fusionnées)
+        self._pending_lines: list[bytes] = []  # Lignes JSONL pas encore écrites
+        self._save_dirty = False
+        self._save_task: Optional[asyncio.Task] = None
+        self._save_lock = asyncio.Lock()  # Une seule écriture fichier à la fois
         
         # Charger l'historique
         self._load_history()
     
     @property
     def open_orders(self) -> list[ActiveOrder]:
-        """Liste des ordres ouverts."""
-        return [o for o in self._orders.values() if o.status == "open"]
+        """Liste des ordres ouverts (O(#ouverts), pas de parcours de tous les ordres)."""
+        return list(self._open_orders.values())
     
     @property
     def open_positions_count(self) -> int:
@@ -193,7 +235,7 @@ class OrderManager:
     def stats(self) -> dict:
         """Statistiques globales."""
         return {
-            "open_orders": len(self.open_orders),
+            "open_orders": len(self._open_orders),
             "open_positions": self.open_positions_count,
             "total_exposure": self.total_exposure,
             "total_pnl": self._total_pnl,
@@ -205,6 +247,15 @@ class OrderManager:
     def add_order(self, order: ActiveOrder) -> None:
         """Ajoute un ordre."""
         self._orders[order.id] = order
+        if order.status == "open":
+            self._open_orders[order.id] = order
+        else:
+            self._open_orders.pop(order.id, None)
+
+    def add_orders(self, orders: Iterable[ActiveOrder]) -> None:
+        """Ajoute plusieurs ordres (ex: les deux legs d'un trade bilatéral)."""
+        for order in orders:
+            self.add_order(order)
     
     def get_order(self, order_id: str) -> Optional[ActiveOrder]:
         """Récupère un ordre par ID."""
@@ -217,15 +268,21 @@ class OrderManager:
         filled_size: Optional[float] = None
     ) -> None:
         """Met à jour le statut d'un ordre."""
-        if order_id in self._orders:
-            self._orders[order_id].status = status
+        order = self._orders.get(order_id)
+        if order is not None:
+            order.status = status
             if filled_size is not None:
-                self._orders[order_id].filled_size = filled_size
+                order.filled_size = filled_size
             if status == "filled":
-                self._orders[order_id].filled_at = datetime.now()
+                order.filled_at = datetime.now()
+            if status == "open":
+                self._open_orders[order_id] = order
+            else:
+                self._open_orders.pop(order_id, None)
     
     def remove_order(self, order_id: str) -> Optional[ActiveOrder]:
         """Supprime un ordre."""
+        self._open_orders.pop(order_id, None)
         return self._orders.pop(order_id, None)
     
     def get_position(self, market_id: str) -> Optional[Position]:
@@ -290,9 +347,10 @@ class OrderManager:
         self._total_trades += 1
         if pnl > 0:
             self._winning_trades += 1
+        self._daily_pnl[now.date()] += pnl
         
         # Sauvegarder
-        self._save_history()
+        self._save_history(history)
         
         # Supprimer les ordres associés
         if position.order_yes_id:
@@ -305,55 +363,114 @@ class OrderManager:
     def clear(self) -> None:
         """Efface tous les ordres et positions."""
         self._orders.clear()
+        self._open_orders.clear()
         self._positions.clear()
     
     def _load_history(self) -> None:
-        """Charge l'historique depuis le fichier."""
+        """Charge les compteurs et les 100 derniers trades du journal."""
         if self._trades_file.exists():
             try:
                 with open(self._trades_file, "r") as f:
-                    data = json.load(f)
+                    data = json_loads(f.read())
                     self._total_pnl = data.get("total_pnl", 0)
                     self._total_trades = data.get("total_trades", 0)
                     self._winning_trades = data.get("winning_trades", 0)
             except Exception:
                 pass
-    
-    def _save_history_sync(self) -> None:
-        """Sauvegarde synchrone de l'historique (interne)."""
-        self._trades_file.parent.mkdir(parents=True, exist_ok=True)
-        data = {
+
+        if self._trades_log.exists():
+            try:
+                with open(self._trades_log, "r") as f:
+                    lines = deque(f, maxlen=100)  # Ne garde que la fin du fichier
+                for line in lines:
+                    try:
+                        history = TradeHistory.from_dict(json_loads(line))
+                    except (ValueError, KeyError):
+                        continue  # Ligne tronquée (arrêt pendant une écriture)
+                    self._history.append(history)
+                    self._daily_pnl[history.closed_at.date()] += history.pnl
+            except Exception:
+                pass
+
+    def _summary_snapshot(self) -> dict:
+        """Construit les compteurs à sauvegarder (sur le thread appelant)."""
+        return {
             "total_pnl": self._total_pnl,
             "total_trades": self._total_trades,
             "winning_trades": self._winning_trades,
-            "history": [h.to_dict() for h in self._history[-100:]]  # Garder les 100 derniers
         }
-        with open(self._trades_file, "w") as f:
-            json.dump(data, f, indent=2)
 
-    def _save_history(self) -> None:
-        """5.3: Sauvegarde non-bloquante de l'historique."""
+    def _write_history(self, lines: list[bytes], summary: dict) -> None:
+        """Ajoute les trades au journal JSONL et réécrit les compteurs."""
+        self._trades_file.parent.mkdir(parents=True, exist_ok=True)
+        if lines:
+            with open(self._trades_log, "ab") as f:
+                f.writelines(lines)
+        with open(self._trades_file, "wb") as f:
+            f.write(json_dumps_bytes(summary))
+
+    def _take_pending(self) -> list[bytes]:
+        """Récupère et vide les lignes en attente."""
+        lines = self._pending_lines
+        self._pending_lines = []
+        return lines
+
+    def _save_history_sync(self) -> None:
+        """Sauvegarde synchrone de l'historique (interne)."""
+        self._write_history(self._take_pending(), self._summary_snapshot())
+
+    def _save_history(self, history: TradeHistory) -> None:
+        """
+        5.3: Sauvegarde non-bloquante d'un trade fermé.
+
+        O(1) par trade: une ligne ajoutée au journal, pas de réécriture
+        de l'historique complet.
+        """
+        self._pending_lines.append(json_dumps_bytes(history.to_dict()) + b"\n")
+
         try:
             loop = asyncio.get_running_loop()
-            # Si dans un contexte async, exécuter en thread séparé
-            loop.run_in_executor(None, self._save_history_sync)
         except RuntimeError:
             # Pas de loop async, exécution synchrone
             self._save_history_sync()
+            return
+
+        # Si une écriture est déjà en cours, elle reprendra les lignes en attente
+        self._save_dirty = True
+        if self._save_task is None or self._save_task.done():
+            self._save_task = loop.create_task(self._persist_loop())
+
+    async def _persist_loop(self) -> None:
+        """Écrit le journal tant que des modifications sont en attente."""
+        while self._save_dirty:
+            self._save_dirty = False
+            # Snapshot pris sur la loop: pas de lecture concurrente des compteurs
+            async with self._save_lock:
+                lines = self._take_pending()
+                summary = self._summary_snapshot()
+                try:
+                    await asyncio.to_thread(self._write_history, lines, summary)
+                except Exception as e:
+                    # Lignes remises en tête: réécrites à la prochaine sauvegarde
+                    self._pending_lines[:0] = lines
+                    log.warning("⚠️ Erreur sauvegarde historique: %s", e)
 
     async def _save_history_async(self) -> None:
         """5.3: Sauvegarde asynchrone de l'historique."""
-        await asyncio.to_thread(self._save_history_sync)
+        async with self._save_lock:
+            lines = self._take_pending()
+            try:
+                await asyncio.to_thread(self._write_history, lines, self._summary_snapshot())
+            except Exception:
+                # Comme _persist_loop: lignes remises en tête, pas de trade perdu
+                self._pending_lines[:0] = lines
+                raise
     
     def get_daily_pnl(self) -> float:
-        """Calcule le PnL du jour."""
-        today = datetime.now().date()
-        daily_pnl = sum(
-            h.pnl for h in self._history
-            if h.closed_at.date() == today
-        )
-        return daily_pnl
+        """Retourne le PnL du jour (compteur tenu à jour par close_position)."""
+        return self._daily_pnl.get(datetime.now().date(), 0.0)
     
     def get_recent_trades(self, limit: int = 10) -> list[TradeHistory]:
         """Récupère les trades récents."""
-        return self._history[-limit:][::-1]
+        # Parcours depuis la fin: O(limit), sans copie de l'historique
+        return list(islice(reversed(self._history), max(limit, 0)))
@@ -5,10 +5,17 @@ Optimisations incluses:
 1. uvloop - Event loop 2-4x plus rapide que asyncio par défaut
 2. orjson - Sérialisation JSON 10x plus rapide
 3. TTLCache - Cache en mémoire avec expiration automatique
+4. Logging non-bloquant - écriture stdout sur un thread dédié
 """
 
 import sys
+import time
+import atexit
 import asyncio
+import logging
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any, Optional
 from functools import lru_cache
 
@@ -75,6 +82,11 @@ def is_uvloop_available() -> bool:
 try:
     import orjson
     _HAS_ORJSON = True
+    # Liés une fois: pas de lookup d'attribut module à chaque appel
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+    # Clés non-str (int, date...) acceptées comme avec json.dumps
+    _DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS
 except ImportError:
     _HAS_ORJSON = False
     import json as _json
@@ -84,10 +96,11 @@ def json_dumps(obj: Any) -> str:
     """
     Sérialise un objet en JSON (utilise orjson si disponible).
 
-    ~10x plus rapide que json.dumps standard.
+    ~10x plus rapide que json.dumps standard. Préférer json_dumps_bytes
+    quand la destination accepte des bytes (évite le décodage UTF-8).
     """
     if _HAS_ORJSON:
-        return orjson.dumps(obj).decode("utf-8")
+        return _dumps(obj, option=_DUMPS_OPTIONS).decode("utf-8")
     return _json.dumps(obj)
 
 
@@ -95,10 +108,10 @@ def json_dumps_bytes(obj: Any) -> bytes:
     """
     Sérialise un objet en JSON bytes (utilise orjson si disponible).
 
-    Optimal pour les réponses HTTP directes.
+    Optimal pour les réponses HTTP directes et les fichiers binaires.
     """
     if _HAS_ORJSON:
-        return orjson.dumps(obj)
+        return _dumps(obj, option=_DUMPS_OPTIONS)
     return _json.dumps(obj).encode("utf-8")
 
 
@@ -109,7 +122,7 @@ def json_loads(data: str | bytes) -> Any:
     ~3x plus rapide que json.loads standard.
     """
     if _HAS_ORJSON:
-        return orjson.loads(data)
+        return _loads(data)
     if isinstance(data, bytes):
         data = data.decode("utf-8")
     return _json.loads(data)
@@ -139,11 +152,12 @@ class MarketCache:
             maxsize: Nombre max d'entrées en cache
             ttl: Durée de vie en secondes
         """
+        self.ttl = ttl
         if _HAS_CACHETOOLS:
             self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
         else:
             self._cache = {}
-            self._ttl = ttl
+            self._maxsize = maxsize
         self._hits = 0
         self._misses = 0
 
@@ -151,6 +165,12 @@ class MarketCache:
         """Récupère une valeur du cache."""
         try:
             value = self._cache.get(key)
+            if value is not None and not _HAS_CACHETOOLS:
+                # Repli dict: (expiration, valeur), expiration vérifiée à la lecture
+                expires_at, value = value
+                if expires_at < time.monotonic():
+                    del self._cache[key]
+                    value = None
             if value is not None:
                 self._hits += 1
             else:
@@ -163,7 +183,12 @@ class MarketCache:
     def set(self, key: str, value: Any) -> None:
         """Stocke une valeur dans le cache."""
         try:
-            self._cache[key] = value
+            if _HAS_CACHETOOLS:
+                self._cache[key] = value
+            else:
+                if len(self._cache) >= self._maxsize and key not in self._cache:
+                    self._cache.pop(next(iter(self._cache)))  # Plus ancienne entrée
+                self._cache[key] = (time.monotonic() + self.ttl, value)
         except Exception:
             pass
 
@@ -204,6 +229,78 @@ orderbook_cache = MarketCache(maxsize=500, ttl=0.5)
 market_cache = MarketCache(maxsize=200, ttl=30.0)
 
 
+# ═══════════════════════════════════════════════════════════════
+# LOGGING NON-BLOQUANT
+# ═══════════════════════════════════════════════════════════════
+
+class _CurrentStdoutHandler(logging.StreamHandler):
+    """StreamHandler qui écrit sur le sys.stdout courant (lu à chaque émission)."""
+
+    def __init__(self):
+        super().__init__()
+        self.setFormatter(logging.Formatter("%(message)s"))
+
+    @property
+    def stream(self):
+        # Suit les redirections de sys.stdout (TUI, capture de tests)
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler qui laisse le formatage au thread d'écriture et ne
+    démarre ce thread qu'au premier message.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Les args des appelants sont des scalaires: pas de copie nécessaire
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if _log_listener is None:
+            _start_log_listener()
+        self.queue.put_nowait(record)
+
+
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_listener: Optional[QueueListener] = None
+_log_listener_lock = threading.Lock()
+
+
+def _start_log_listener() -> None:
+    """Démarre (une seule fois) le thread d'écriture partagé par les loggers async."""
+    global _log_listener
+    with _log_listener_lock:
+        if _log_listener is None:
+            listener = QueueListener(_log_queue, _CurrentStdoutHandler())
+            listener.start()
+            atexit.register(listener.stop)  # Vide la file à la sortie
+            _log_listener = listener
+
+
+def get_async_logger(name: str) -> logging.Logger:
+    """
+    Retourne un logger dont le formatage et l'écriture stdout se font
+    sur un thread (QueueListener): l'appelant ne fait qu'un put() en file,
+    sans I/O bloquante sur l'event loop.
+
+    Indépendant de la configuration du root logger (affiché aussi
+    en mode dashboard, où setup_logging n'est pas appelé). Aucun thread
+    n'est créé à l'import: le listener démarre au premier message, et la
+    sortie suit le sys.stdout courant.
+    """
+    logger = logging.getLogger(name)
+    if not any(isinstance(h, _DeferredQueueHandler) for h in logger.handlers):
+        logger.addHandler(_DeferredQueueHandler(_log_queue))
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    return logger
+
+
 # ═══════════════════════════════════════════════════════════════
 # DIAGNOSTIC
 # ═══════════════════════════════════════════════════════════════
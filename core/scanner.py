@@ -17,7 +17,6 @@ Optimisations HFT v2.0:
 import asyncio
 from typing import Optional, Callable, Any
 from dataclasses import dataclass, field
-from datetime import datetime
 from enum import Enum
 import time
 
@@ -25,6 +24,21 @@ from api.public import PolymarketPublicClient, GammaClient, WebSocketFeed
 from api.public.polymarket_public import Market, OrderBook
 from api.public.websocket_feed import PriceUpdate, BookUpdate
 from config import get_settings, get_trading_params
+from core.performance import orderbook_cache
+
+
+# Horloge des updates de marché (float, sans allocation datetime par tick)
+_now = time.monotonic
+
+
+def _parse_top(orderbook: dict, _float=float) -> tuple[Optional[float], Optional[float]]:
+    """Extrait (best_bid, best_ask) d'un orderbook REST (None si côté vide)."""
+    bids = orderbook.get("bids")
+    asks = orderbook.get("asks")
+    return (
+        _float(bids[0]["price"]) if bids else None,
+        _float(asks[0]["price"]) if asks else None,
+    )
 
 
 class ScannerState(Enum):
@@ -36,9 +50,9 @@ class ScannerState(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketData:
-    """Données complètes d'un marché."""
+    """Données complètes d'un marché (slots: pas de __dict__, mutée à chaque tick WS)."""
     market: Market
     orderbook_yes: Optional[dict] = None
     orderbook_no: Optional[dict] = None
@@ -54,13 +68,18 @@ class MarketData:
     spread_no: Optional[float] = None
     
     # Métadonnées
-    last_update: datetime = field(default_factory=datetime.now)
+    last_update: float = field(default_factory=time.monotonic)  # time.monotonic() du dernier update
     
     @property
     def effective_spread(self) -> float:
         """Spread effectif moyen."""
-        spreads = [s for s in [self.spread_yes, self.spread_no] if s is not None]
-        return sum(spreads) / len(spreads) if spreads else 0.0
+        spread_yes = self.spread_yes
+        spread_no = self.spread_no
+        if spread_yes is None:
+            return spread_no if spread_no is not None else 0.0
+        if spread_no is None:
+            return spread_yes
+        return (spread_yes + spread_no) / 2
     
     @property
     def is_valid(self) -> bool:
@@ -113,18 +132,31 @@ class MarketScanner:
         self._avg_cycle_duration: float = 0.0
         self._ws_updates: int = 0  # Compteur updates WebSocket
 
-        # Mapping token_id -> market_id pour WebSocket
-        self._token_to_market: dict[str, tuple[str, str]] = {}  # token_id -> (market_id, "yes"|"no")
+        # Mapping token_id -> MarketData pour WebSocket (référence directe, un seul lookup)
+        self._token_to_market: dict[str, tuple[MarketData, bool]] = {}  # token_id -> (market_data, is_yes)
 
         # IDs prioritaires pour refresh (marchés avec positions actives)
         self._priority_market_ids: set = set()
 
+        # WebSocket connecté: REST seulement pour les carnets sans update
+        # depuis ce délai (2x le TTL du cache orderbook, soit 1s)
+        self._staleness_threshold: float = 2 * orderbook_cache.ttl
+
         # Flag pour éviter spam logs WebSocket
         self._ws_logged_disconnect: bool = False
 
         # 5.12: Cache métadonnées marchés (refresh périodique)
         self._last_markets_refresh: float = 0.0
         self._markets_refresh_interval: float = 60.0  # Refresh liste marchés toutes les 60s
+
+        # Statistiques agrégées incrémentales (lues par l'AutoOptimizer en O(1))
+        self._spread_sum: float = 0.0
+        self._spread_count: int = 0
+        self._spread_contrib: dict[str, float] = {}  # market_id -> spread compté (0 = exclu)
+        self._volume_sum: float = 0.0
+        self._volume_count: int = 0
+        self._liquidity_sum: float = 0.0
+        self._liquidity_count: int = 0
     
     @property
     def state(self) -> ScannerState:
@@ -141,6 +173,62 @@ class MarketScanner:
         """Nombre de marchés suivis."""
         return len(self._markets)
 
+    @property
+    def market_averages(self) -> Optional[tuple[Optional[float], Optional[float], Optional[float]]]:
+        """
+        Moyennes (spread, volume, liquidité) maintenues incrémentalement.
+
+        Chaque moyenne vaut None si aucun marché n'y contribue.
+        Retourne None si les compteurs sont incohérents (recalcul complet requis).
+        """
+        n = len(self._markets)
+        if (self._spread_count > n or self._volume_count > n or self._liquidity_count > n
+                or self._spread_count < 0):
+            return None
+        return (
+            self._spread_sum / self._spread_count if self._spread_count else None,
+            self._volume_sum / self._volume_count if self._volume_count else None,
+            self._liquidity_sum / self._liquidity_count if self._liquidity_count else None,
+        )
+
+    def _track_market(self, market_data: MarketData) -> None:
+        """Ajoute volume/liquidité/spread d'un marché aux agrégats."""
+        market = market_data.market
+        if market.volume > 0:
+            self._volume_sum += market.volume
+            self._volume_count += 1
+        if market.liquidity > 0:
+            self._liquidity_sum += market.liquidity
+            self._liquidity_count += 1
+        self._update_spread_stats(market_data)
+
+    def _update_spread_stats(self, market_data: MarketData) -> None:
+        """Remplace la contribution spread d'un marché (retire l'ancienne, ajoute la nouvelle)."""
+        market_id = market_data.market.id
+        old = self._spread_contrib.get(market_id, 0.0)
+        new = market_data.effective_spread if market_data.is_valid else 0.0
+        if new < 0:
+            new = 0.0
+        if old == new:
+            return
+        if old:
+            self._spread_sum -= old
+            self._spread_count -= 1
+        if new:
+            self._spread_sum += new
+            self._spread_count += 1
+        self._spread_contrib[market_id] = new
+
+    def _recompute_market_stats(self) -> None:
+        """Recalcul complet des agrégats (resynchronise la dérive flottante)."""
+        self._spread_sum = 0.0
+        self._spread_count = 0
+        self._spread_contrib.clear()
+        self._volume_sum = self._liquidity_sum = 0.0
+        self._volume_count = self._liquidity_count = 0
+        for market_data in self._markets.values():
+            self._track_market(market_data)
+
     @property
     def performance_stats(self) -> dict:
         """Retourne les statistiques de performance du scanner."""
@@ -179,6 +267,7 @@ class MarketScanner:
 
             # Charger les marchés initiaux
             await self._load_markets()
+            self._recompute_market_stats()
 
             # Initialiser le WebSocket pour données temps réel
             await self._init_websocket()
@@ -239,52 +328,47 @@ class MarketScanner:
             print(f"ℹ️ [WS] Mode REST uniquement (WebSocket: {type(e).__name__})")
 
     def _build_token_mapping(self) -> None:
-        """Construit le mapping token_id -> (market_id, side)."""
+        """Construit le mapping token_id -> (market_data, is_yes)."""
         self._token_to_market.clear()
-        for market_id, market_data in self._markets.items():
+        for market_data in self._markets.values():
             market = market_data.market
-            self._token_to_market[market.token_yes_id] = (market_id, "yes")
-            self._token_to_market[market.token_no_id] = (market_id, "no")
+            self._token_to_market[market.token_yes_id] = (market_data, True)
+            self._token_to_market[market.token_no_id] = (market_data, False)
 
     def _handle_price_update(self, update: PriceUpdate) -> None:
         """Handler pour les mises à jour de prix WebSocket."""
-        mapping = self._token_to_market.get(update.token_id)
-        if not mapping:
+        entry = self._token_to_market.get(update.token_id)
+        if entry is None:
             return
 
-        market_id, side = mapping
-        market_data = self._markets.get(market_id)
-        if not market_data:
-            return
+        market_data, is_yes = entry
 
         self._ws_updates += 1
 
         # Mettre à jour le prix selon le côté
-        if side == "yes":
+        if is_yes:
             market_data.best_ask_yes = update.price
         else:
             market_data.best_ask_no = update.price
 
-        market_data.last_update = datetime.now()
+        self._update_spread_stats(market_data)
+        market_data.last_update = _now()
 
         if self.on_market_update:
             self.on_market_update(market_data)
 
     def _handle_book_update(self, update: BookUpdate) -> None:
         """Handler pour les mises à jour d'orderbook WebSocket."""
-        mapping = self._token_to_market.get(update.token_id)
-        if not mapping:
+        entry = self._token_to_market.get(update.token_id)
+        if entry is None:
             return
 
-        market_id, side = mapping
-        market_data = self._markets.get(market_id)
-        if not market_data:
-            return
+        market_data, is_yes = entry
 
         self._ws_updates += 1
 
         # Mettre à jour les prix et spreads
-        if side == "yes":
+        if is_yes:
             if update.bids:
                 market_data.best_bid_yes = update.bids[0][0]
             if update.asks:
@@ -299,7 +383,8 @@ class MarketScanner:
             if market_data.best_bid_no and market_data.best_ask_no:
                 market_data.spread_no = market_data.best_ask_no - market_data.best_bid_no
 
-        market_data.last_update = datetime.now()
+        self._update_spread_stats(market_data)
+        market_data.last_update = _now()
 
         if self.on_market_update:
             self.on_market_update(market_data)
@@ -465,11 +550,18 @@ class MarketScanner:
         # 5.12: Vérifier si on doit rafraîchir la liste des marchés
         if now - self._last_markets_refresh >= self._markets_refresh_interval:
             await self._load_markets()
+            self._recompute_market_stats()  # Nouveaux marchés + resync dérive flottante
             self._last_markets_refresh = now
         # Sinon, on garde les marchés existants et on update juste les orderbooks
     
     async def _fetch_single_orderbook(self, market_data: MarketData) -> None:
         """Worker pour update un seul orderbook (optimisé: parallel + cache)."""
+        # Carnets déjà parsés et appliqués depuis moins que le TTL du cache:
+        # ni requête ni parsing (et pas d'écrasement d'updates WS plus récentes)
+        top_key = f"top:{market_data.market.id}"
+        if orderbook_cache.get(top_key) is not None:
+            return
+
         async with self._concurrency:
             try:
                 # 5.4 + 5.5: Fetch YES et NO en PARALLÈLE avec cache activé
@@ -486,23 +578,26 @@ class MarketScanner:
 
                 # Parse YES orderbook
                 market_data.orderbook_yes = orderbook_yes
-                bids = orderbook_yes.get("bids", [])
-                asks = orderbook_yes.get("asks", [])
-                market_data.best_bid_yes = float(bids[0]["price"]) if bids else None
-                market_data.best_ask_yes = float(asks[0]["price"]) if asks else None
-                if market_data.best_bid_yes and market_data.best_ask_yes:
-                    market_data.spread_yes = market_data.best_ask_yes - market_data.best_bid_yes
+                bid, ask = _parse_top(orderbook_yes)
+                market_data.best_bid_yes = bid
+                market_data.best_ask_yes = ask
+                if bid and ask:
+                    market_data.spread_yes = ask - bid
 
                 # Parse NO orderbook
                 market_data.orderbook_no = orderbook_no
-                bids = orderbook_no.get("bids", [])
-                asks = orderbook_no.get("asks", [])
-                market_data.best_bid_no = float(bids[0]["price"]) if bids else None
-                market_data.best_ask_no = float(asks[0]["price"]) if asks else None
-                if market_data.best_bid_no and market_data.best_ask_no:
-                    market_data.spread_no = market_data.best_ask_no - market_data.best_bid_no
+                bid, ask = _parse_top(orderbook_no)
+                market_data.best_bid_no = bid
+                market_data.best_ask_no = ask
+                if bid and ask:
+                    market_data.spread_no = ask - bid
+
+                orderbook_cache.set(top_key, (
+                    market_data.best_bid_yes, market_data.best_ask_yes, bid, ask
+                ))
 
-                market_data.last_update = datetime.now()
+                self._update_spread_stats(market_data)
+                market_data.last_update = _now()
 
                 if self.on_market_update:
                     self.on_market_update(market_data)
@@ -519,6 +614,11 @@ class MarketScanner:
         if not self._polymarket_client:
             return
 
+        # Carnets poussés par le WebSocket: ne récupérer en REST que les
+        # marchés silencieux depuis _staleness_threshold (et les prioritaires)
+        ws_live = self._ws_feed is not None and self._ws_feed.is_connected
+        stale_before = _now() - self._staleness_threshold
+
         # Séparer marchés prioritaires et autres
         priority_markets = []
         other_markets = []
@@ -526,18 +626,18 @@ class MarketScanner:
         for md in self._markets.values():
             if md.market.id in self._priority_market_ids:
                 priority_markets.append(md)
-            else:
+            elif not ws_live or md.last_update < stale_before:
                 other_markets.append(md)
 
-        # Fetch prioritaires d'abord (données plus fraîches pour stratégie)
+        # Une seule vague, prioritaires en tête: les tâches sont lancées dans
+        # cet ordre et prennent le sémaphore en premier, sans attendre la fin
+        # d'une vague prioritaire. on_market_update part de chaque tâche dès
+        # que son carnet arrive.
+        priority_markets.extend(other_markets)
         if priority_markets:
-            priority_tasks = [self._fetch_single_orderbook(md) for md in priority_markets]
-            await asyncio.gather(*priority_tasks)
-
-        # Puis les autres
-        if other_markets:
-            other_tasks = [self._fetch_single_orderbook(md) for md in other_markets]
-            await asyncio.gather(*other_tasks)
+            await asyncio.gather(*(
+                self._fetch_single_orderbook(md) for md in priority_markets
+            ))
 
     def set_priority_markets(self, market_ids: set) -> None:
         """Définit les marchés prioritaires pour le refresh."""
@@ -178,6 +178,11 @@ def main():
 ╚═══════════════════════════════════════════════════════════════╝
     """)
     
+    # uvloop pour tout le process (executor, scanner, UI): doit être installé
+    # avant la création de l'event loop par asyncio.run / Textual
+    from core.performance import setup_uvloop
+    setup_uvloop()
+    
     if args.cli:
         # Mode CLI
         asyncio.run(run_cli_mode())
@@ -18,6 +18,7 @@ Optimisations HFT v2.0:
 """
 
 import asyncio
+from dataclasses import replace
 from datetime import datetime
 from typing import Optional
 from pathlib import Path
@@ -455,7 +456,7 @@ async def get_market_maker_status():
             "is_running": False,
             "stats": {},
             "positions": [],
-            "config": MMConfig().__dict__
+            "config": MMConfig().to_dict()
         }
 
     return {
@@ -490,11 +491,15 @@ async def update_market_maker_config(config: MMConfigUpdate):
     if not market_maker:
         market_maker = MarketMaker(private_client=private_client)
 
-    market_maker.config.target_spread = config.target_spread
-    market_maker.config.order_size = config.order_size
-    market_maker.config.max_position = config.max_position
-    market_maker.config.price_offset = config.price_offset
-    market_maker.config.refresh_interval = config.refresh_interval
+    # MMConfig est immuable: nouvelle instance (valeurs dérivées recalculées)
+    market_maker.config = replace(
+        market_maker.config,
+        target_spread=config.target_spread,
+        order_size=config.order_size,
+        max_position=config.max_position,
+        price_offset=config.price_offset,
+        refresh_interval=config.refresh_interval,
+    )
 
     return {"success": True, "message": "Configuration MM mise à jour", "config": config.dict()}
 
@@ -799,31 +804,41 @@ async def broadcast_loop():
                     # Mettre à jour les marchés prioritaires pour le scanner
                     scanner.set_priority_markets(gabagool_engine.get_active_position_ids())
 
-                    for market_id, market_data in markets.items():
-                        if not market_data.is_valid:
-                            continue
-                        market = market_data.market
-                        # Analyser si on doit acheter YES ou NO
-                        action = await gabagool_engine.analyze_opportunity(
-                            market_id=market_id,
-                            token_yes_id=market.token_yes_id,
-                            token_no_id=market.token_no_id,
-                            price_yes=market_data.best_ask_yes or 0.5,
-                            price_no=market_data.best_ask_no or 0.5,
-                            question=market.question
+                    # Analyser tous les marchés en un lot (YES, NO ou rien)
+                    actions = await gabagool_engine.analyze_opportunities(
+                        (
+                            market_id,
+                            market_data.market.token_yes_id,
+                            market_data.market.token_no_id,
+                            market_data.best_ask_yes or 0.5,
+                            market_data.best_ask_no or 0.5,
+                            market_data.market.question,
                         )
+                        for market_id, market_data in markets.items()
+                        if market_data.is_valid
+                    )
+                    # Envoyer tous les ordres du scan en parallèle
+                    batch = []
+                    order_size = gabagool_engine.config.order_size_usd
+                    for market_id, action in actions:
+                        market_data = markets.get(market_id)
+                        if market_data is None:
+                            continue  # Marché retiré pendant l'analyse
+                        market = market_data.market
                         if action == "buy_yes":
-                            qty = gabagool_engine.config.order_size_usd / (market_data.best_ask_yes or 0.5)
-                            await gabagool_engine.buy_yes(
-                                market_id, market.token_yes_id,
+                            qty = order_size / (market_data.best_ask_yes or 0.5)
+                            batch.append((
+                                action, market_id, market.token_yes_id,
                                 market_data.best_ask_yes, qty, market.question
-                            )
+                            ))
                         elif action == "buy_no":
-                            qty = gabagool_engine.config.order_size_usd / (market_data.best_ask_no or 0.5)
-                            await gabagool_engine.buy_no(
-                                market_id, market.token_no_id,
+                            qty = order_size / (market_data.best_ask_no or 0.5)
+                            batch.append((
+                                action, market_id, market.token_no_id,
                                 market_data.best_ask_no, qty, market.question
-                            )
+                            ))
+                    if batch:
+                        await gabagool_engine.execute_batch(batch)
 
                 # Update trade prices if any
                 if trade_manager:
@@ -917,13 +932,13 @@ async def get_performance():
 if __name__ == "__main__":
     import uvicorn
 
-    # Activer uvloop AVANT de démarrer uvicorn
-    setup_uvloop()
+    # Activer uvloop AVANT de démarrer uvicorn (repli asyncio: Windows, non installé)
+    loop_impl = "uvloop" if setup_uvloop() else "asyncio"
 
     uvicorn.run(
         "web.server:app",
         host="0.0.0.0",
         port=8000,
         reload=True,
-        loop="uvloop"  # Utiliser uvloop si disponible
+        loop=loop_impl
     )